@@ -2,19 +2,21 @@
 Resume API endpoints for parsing and management
 """
 
+import asyncio
+import json
 import os
 import tempfile
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.database import get_db, Resume
+from app.core.database import get_db, AsyncSessionLocal, Resume
 from app.models.resume import ParsedResumeResponse, ResumeResponse, ResumeList
 from app.services.resume_parser import ResumeParserService
 from app.core.config import settings
@@ -28,6 +30,46 @@ router = APIRouter()
 # Initialize resume parser service
 resume_parser = ResumeParserService()
 
+# Queues of connected /resumes/stream clients (per worker process)
+resume_listeners: Set[asyncio.Queue] = set()
+
+# Seconds between keep-alive comments on an idle resume stream
+STREAM_KEEPALIVE_SECONDS = 5
+
+# Seconds before a resume stream ends and the client reconnects. uvicorn waits
+# for open connections on shutdown and --reload, so streams must not be endless
+STREAM_MAX_SECONDS = 10
+
+
+def notify_resume_change():
+    """Wake every connected resume stream so it re-sends the recent resumes"""
+    for queue in resume_listeners:
+        # A pending wake-up already covers this change
+        if queue.empty():
+            queue.put_nowait(None)
+
+
+async def get_recent_resumes_json(limit: int) -> str:
+    """Serialize the most recent resumes in the same shape as list_resumes"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Resume)
+            .order_by(Resume.created_at.desc())
+            .limit(limit)
+        )
+        resumes = [
+            ResumeResponse(
+                id=resume.id,
+                filename=resume.filename,
+                name=resume.name,
+                email=resume.email,
+                phone=resume.phone,
+                created_at=resume.created_at
+            ).model_dump(mode="json")
+            for resume in result.scalars().all()
+        ]
+    return json.dumps(resumes)
+
 
 @router.post("/parse_resume", response_model=ParsedResumeResponse)
 async def parse_resume(
@@ -99,6 +141,7 @@ async def parse_resume(
         db.add(db_resume)
         await db.commit()
         await db.refresh(db_resume)
+        notify_resume_change()
         
         logger.info(f"Successfully parsed and saved resume: {resume_id}")
         
@@ -131,6 +174,57 @@ async def parse_resume(
                 logger.warning(f"Failed to delete temp file {temp_file}: {e}")
 
 
+@router.get("/resumes/stream")
+async def stream_recent_resumes(
+    request: Request,
+    limit: int = Query(5, ge=1, le=50, description="Number of recent resumes per event")
+):
+    """
+    Stream the most recent resumes as server-sent events
+    
+    An event is sent on connect and again whenever a resume is parsed,
+    reparsed or deleted, so clients don't have to poll /resumes. The stream
+    ends after STREAM_MAX_SECONDS; clients are expected to reconnect.
+    
+    Args:
+        request: Incoming request, used to detect disconnects
+        limit: Number of recent resumes per event
+        
+    Returns:
+        StreamingResponse of text/event-stream events
+    """
+    
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STREAM_MAX_SECONDS
+        queue = asyncio.Queue(maxsize=1)
+        resume_listeners.add(queue)
+        try:
+            while True:
+                yield f"data: {await get_recent_resumes_json(limit)}\n\n"
+                
+                # Wait for the next change, sending keep-alives while idle
+                while True:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return
+                    try:
+                        await asyncio.wait_for(queue.get(), timeout=min(STREAM_KEEPALIVE_SECONDS, remaining))
+                        break
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield ": keep-alive\n\n"
+        finally:
+            resume_listeners.discard(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/resumes/{resume_id}", response_model=ParsedResumeResponse)
 async def get_resume(
     resume_id: str,
@@ -264,6 +358,7 @@ async def delete_resume(
     # Delete from database
     await db.delete(db_resume)
     await db.commit()
+    notify_resume_change()
     
     logger.info(f"Successfully deleted resume: {resume_id}")
     
@@ -352,6 +447,7 @@ async def reparse_resume(
         
         await db.commit()
         await db.refresh(db_resume)
+        notify_resume_change()
         
         logger.info(f"Successfully reparsed resume: {resume_id}")
         
@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db, Resume, ResumeScore, JobDescription
-from app.models.scoring import ScoreRequest, ScoreResponse, SuggestionResponse, Suggestion
+from app.models.scoring import (
+    ScoreRequest, ScoreResponse, BatchScoreRequest, BatchScoreResponse, SuggestionResponse, Suggestion
+)
 from app.models.job_description import JobDescriptionCreate, JobDescriptionResponse
 from app.services.ats_scorer import ATSScorerService
 
@@ -102,30 +104,7 @@ async def score_resume(
         
         logger.info(f"Successfully scored resume. Overall score: {scoring_result['overall_score']:.3f}")
         
-        # Format section scores for response
-        section_scores_list = []
-        for section_name, section_data in scoring_result['section_scores'].items():
-            section_scores_list.append({
-                'section': section_name,
-                'score': section_data['score'],
-                'matched_keywords': section_data['matched_keywords'],
-                'missing_keywords': section_data['missing_keywords'],
-                'weight': section_data['weight']
-            })
-        
-        return ScoreResponse(
-            score_id=db_score.id,
-            resume_id=request.resume_id,
-            overall_score=scoring_result['overall_score'],
-            section_scores=section_scores_list,
-            total_matched_keywords=scoring_result['matched_keywords'],
-            total_missing_keywords=scoring_result['missing_keywords'],
-            keyword_density=scoring_result['keyword_density'],
-            job_title=request.job_title,
-            company=request.company,
-            scoring_method=scoring_result['scoring_method'],
-            created_at=db_score.created_at
-        )
+        return build_score_response(db_score, scoring_result, request.job_title, request.company)
         
     except Exception as e:
         logger.error(f"Error scoring resume {request.resume_id}: {str(e)}")
@@ -135,6 +114,129 @@ async def score_resume(
         )
 
 
+@router.post("/score_resume_batch", response_model=BatchScoreResponse)
+async def score_resume_batch(
+    request: BatchScoreRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Score several resumes against the same job description in one request
+    
+    Args:
+        request: BatchScoreRequest with resume IDs and job description
+        db: Database session
+        
+    Returns:
+        BatchScoreResponse with one score per resume found
+    """
+    
+    # Load all requested resumes in a single query
+    result = await db.execute(select(Resume).where(Resume.id.in_(request.resume_ids)))
+    db_resumes = {db_resume.id: db_resume for db_resume in result.scalars().all()}
+    
+    # Keep request order and skip resumes that are missing or unparsed
+    resume_ids = [
+        resume_id for resume_id in dict.fromkeys(request.resume_ids)
+        if resume_id in db_resumes and db_resumes[resume_id].parsed_data
+    ]
+    missing_resume_ids = [resume_id for resume_id in dict.fromkeys(request.resume_ids) if resume_id not in resume_ids]
+    
+    if not resume_ids:
+        raise HTTPException(
+            status_code=404,
+            detail="None of the requested resumes were found or parsed"
+        )
+    
+    try:
+        logger.info(f"Scoring {len(resume_ids)} resumes against job description")
+        
+        # Score all resumes together so the job description is processed once
+        scoring_results = await ats_scorer.score_resumes_batch(
+            parsed_resumes=[db_resumes[resume_id].parsed_data for resume_id in resume_ids],
+            job_description=request.job_description,
+            use_sbert=request.use_sbert,
+            custom_weights=request.score_weights
+        )
+        
+        # Save job description once for the whole batch if provided
+        jd_id = None
+        if request.job_title or request.company:
+            jd_id = str(uuid.uuid4())
+            db.add(JobDescription(
+                id=jd_id,
+                title=request.job_title or "Untitled Position",
+                company=request.company,
+                description=request.job_description
+            ))
+        
+        db_scores = []
+        for resume_id, scoring_result in zip(resume_ids, scoring_results):
+            db_score = ResumeScore(
+                id=str(uuid.uuid4()),
+                resume_id=resume_id,
+                overall_score=scoring_result['overall_score'],
+                skills_score=scoring_result['section_scores'].get('skills', {}).get('score'),
+                experience_score=scoring_result['section_scores'].get('experience', {}).get('score'),
+                education_score=scoring_result['section_scores'].get('education', {}).get('score'),
+                matched_keywords=scoring_result['matched_keywords'],
+                missing_keywords=scoring_result['missing_keywords'],
+                job_description_text=request.job_description,
+                job_description_id=jd_id
+            )
+            db.add(db_score)
+            db_scores.append(db_score)
+        
+        await db.commit()
+        for db_score in db_scores:
+            await db.refresh(db_score)
+        
+        logger.info(f"Successfully scored {len(db_scores)} resumes")
+        
+        return BatchScoreResponse(
+            results=[
+                build_score_response(db_score, scoring_result, request.job_title, request.company)
+                for db_score, scoring_result in zip(db_scores, scoring_results)
+            ],
+            missing_resume_ids=missing_resume_ids
+        )
+        
+    except Exception as e:
+        logger.error(f"Error batch scoring resumes: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to score resumes: {str(e)}"
+        )
+
+
+def build_score_response(db_score: ResumeScore, scoring_result: dict, job_title: Optional[str], company: Optional[str]) -> ScoreResponse:
+    """Format a saved score record and its scoring result for the API response"""
+    
+    # Format section scores for response
+    section_scores_list = []
+    for section_name, section_data in scoring_result['section_scores'].items():
+        section_scores_list.append({
+            'section': section_name,
+            'score': section_data['score'],
+            'matched_keywords': section_data['matched_keywords'],
+            'missing_keywords': section_data['missing_keywords'],
+            'weight': section_data['weight']
+        })
+    
+    return ScoreResponse(
+        score_id=db_score.id,
+        resume_id=db_score.resume_id,
+        overall_score=scoring_result['overall_score'],
+        section_scores=section_scores_list,
+        total_matched_keywords=scoring_result['matched_keywords'],
+        total_missing_keywords=scoring_result['missing_keywords'],
+        keyword_density=scoring_result['keyword_density'],
+        job_title=job_title,
+        company=company,
+        scoring_method=scoring_result['scoring_method'],
+        created_at=db_score.created_at
+    )
+
+
 @router.post("/suggestions", response_model=SuggestionResponse)
 async def get_resume_suggestions(
     request: ScoreRequest,
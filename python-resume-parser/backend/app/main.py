@@ -7,6 +7,7 @@ FastAPI Backend for Resume Parser & ATS Scoring System
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 from contextlib import asynccontextmanager
@@ -80,6 +81,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class SelectiveGZipMiddleware:
+    """GZip middleware that leaves Server-Sent Event streams uncompressed"""
+    
+    def __init__(self, app, minimum_size: int = 500, exclude_paths: tuple = ()):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.exclude_paths = exclude_paths
+    
+    async def __call__(self, scope, receive, send):
+        # The gzip compressor doesn't flush per chunk, so events would sit in its buffer
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+
+# Compress larger responses (parsed resumes carry the full raw text)
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    exclude_paths=("/api/v1/resumes/stream",)
+)
+
 # Include routers
 app.include_router(resumes.router, prefix="/api/v1", tags=["resumes"])
 app.include_router(scoring.router, prefix="/api/v1", tags=["scoring"])
@@ -3,7 +3,7 @@ Pydantic models for API request/response schemas
 """
 
 from .resume import ResumeBase, ResumeCreate, ResumeResponse, ParsedResumeResponse
-from .scoring import ScoreRequest, ScoreResponse, SuggestionResponse
+from .scoring import ScoreRequest, ScoreResponse, BatchScoreRequest, BatchScoreResponse, SuggestionResponse
 from .job_description import JobDescriptionCreate, JobDescriptionResponse
 
 __all__ = [
@@ -13,6 +13,8 @@ __all__ = [
     "ParsedResumeResponse",
     "ScoreRequest",
     "ScoreResponse",
+    "BatchScoreRequest",
+    "BatchScoreResponse",
     "SuggestionResponse",
     "JobDescriptionCreate",
     "JobDescriptionResponse"
@@ -23,6 +23,22 @@ class ScoreRequest(BaseModel):
     )
 
 
+class BatchScoreRequest(BaseModel):
+    """Request model for scoring several resumes against one job description"""
+    resume_ids: List[str] = Field(..., description="IDs of the parsed resumes", min_length=1, max_length=50)
+    job_description: str = Field(..., description="Job description text", min_length=50)
+    job_title: Optional[str] = Field(None, description="Job title")
+    company: Optional[str] = Field(None, description="Company name")
+    
+    # Optional scoring parameters
+    use_sbert: bool = Field(False, description="Use SBERT embeddings for enhanced scoring")
+    score_weights: Optional[Dict[str, float]] = Field(
+        None, 
+        description="Custom weights for scoring sections",
+        example={"skills": 0.4, "experience": 0.35, "education": 0.25}
+    )
+
+
 class SectionScore(BaseModel):
     """Score for a specific resume section"""
     section: str
@@ -58,6 +74,12 @@ class ScoreResponse(BaseModel):
         from_attributes = True
 
 
+class BatchScoreResponse(BaseModel):
+    """Response model for batch resume scoring"""
+    results: List[ScoreResponse] = []
+    missing_resume_ids: List[str] = Field([], description="Requested resumes that were not found or not parsed")
+
+
 class Suggestion(BaseModel):
     """Individual improvement suggestion"""
     type: str = Field(..., description="Type of suggestion (skills, experience, format, etc.)")
@@ -4,6 +4,9 @@ ATS Scoring service - computes resume-job description similarity and provides su
 
 import re
 import logging
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 import string
 import math
@@ -34,6 +37,29 @@ logger = logging.getLogger(__name__)
 class ATSScorerService:
     """Service for ATS scoring and resume improvement suggestions"""
     
+    # Action words that indicate impact and achievement
+    IMPACT_WORDS = (
+        'achieved', 'improved', 'increased', 'decreased', 'reduced', 'optimized',
+        'streamlined', 'developed', 'created', 'implemented', 'launched', 'led',
+        'managed', 'delivered', 'designed', 'built', 'enhanced', 'automated',
+        'scaled', 'grew', 'exceeded', 'outperformed', 'transformed', 'innovated'
+    )
+    
+    # All impact words as one case-insensitive, whole-word pattern
+    IMPACT_RE = re.compile(r'\b(?:' + '|'.join(IMPACT_WORDS) + r')\b', re.IGNORECASE)
+    
+    # Common tech terms normalized during preprocessing
+    TECH_NORMALIZATIONS = {
+        'c plus plus': 'c++',
+        'c sharp': 'c#',
+        'dot net': '.net',
+        'javascript': 'js',
+        'typescript': 'ts',
+        'postgresql': 'postgres',
+        'amazon web services': 'aws',
+        'google cloud platform': 'gcp'
+    }
+    
     def __init__(self):
         self.setup_nlp()
         self.setup_keywords_database()
@@ -61,6 +87,11 @@ class ATSScorerService:
         self.stop_words = set(stopwords.words('english'))
         self.lemmatizer = WordNetLemmatizer()
         
+        # The same job description is scored against many resumes, so keep
+        # its keywords instead of re-running tokenization and TF-IDF. Resume
+        # texts rarely repeat and are not cached.
+        self._jd_keywords_cached = lru_cache(maxsize=32)(self._extract_jd_keywords)
+        
         # Initialize TF-IDF vectorizer
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=5000,
@@ -74,6 +105,8 @@ class ATSScorerService:
         
         # Initialize SBERT if available
         self.sbert_model = None
+        self.jd_embedding_cache = OrderedDict()
+        self.jd_embedding_cache_size = 128
         if SBERT_AVAILABLE:
             try:
                 self.sbert_model = SentenceTransformer(settings.SENTENCE_TRANSFORMER_MODEL)
@@ -148,12 +181,7 @@ class ATSScorerService:
         }
         
         # Action words that indicate impact and achievement
-        self.impact_words = [
-            'achieved', 'improved', 'increased', 'decreased', 'reduced', 'optimized',
-            'streamlined', 'developed', 'created', 'implemented', 'launched', 'led',
-            'managed', 'delivered', 'designed', 'built', 'enhanced', 'automated',
-            'scaled', 'grew', 'exceeded', 'outperformed', 'transformed', 'innovated'
-        ]
+        self.impact_words = list(self.IMPACT_WORDS)
         
         # Quantifiable metrics indicators
         self.metrics_patterns = [
@@ -179,18 +207,7 @@ class ATSScorerService:
         text = re.sub(r'[^\w\s+#./-]', ' ', text)
         
         # Normalize common tech terms
-        tech_normalizations = {
-            'c plus plus': 'c++',
-            'c sharp': 'c#',
-            'dot net': '.net',
-            'javascript': 'js',
-            'typescript': 'ts',
-            'postgresql': 'postgres',
-            'amazon web services': 'aws',
-            'google cloud platform': 'gcp'
-        }
-        
-        for old, new in tech_normalizations.items():
+        for old, new in self.TECH_NORMALIZATIONS.items():
             text = text.replace(old, new)
         
         return text.strip()
@@ -231,6 +248,16 @@ class ATSScorerService:
             word_freq = Counter(tokens)
             return [word for word, freq in word_freq.most_common(top_n)]
     
+    def extract_jd_keywords(self, jd_text: str, top_n: int = 50) -> List[str]:
+        """Extract job description keywords, reusing results for repeated job descriptions"""
+        
+        # Copy so callers can't modify the cached result
+        return list(self._jd_keywords_cached(jd_text, top_n))
+    
+    def _extract_jd_keywords(self, jd_text: str, top_n: int) -> Tuple[str, ...]:
+        """Extract keywords; called through the per-instance LRU cache"""
+        return tuple(self.extract_keywords_from_text(jd_text, top_n))
+    
     def compute_tfidf_similarity(self, resume_text: str, jd_text: str) -> float:
         """Compute cosine similarity between resume and job description using TF-IDF"""
         
@@ -252,6 +279,24 @@ class ATSScorerService:
             logger.error(f"TF-IDF similarity computation failed: {e}")
             return 0.0
     
+    def get_jd_embedding(self, jd_text: str):
+        """Get the SBERT embedding of a job description, reusing cached embeddings for repeated JDs"""
+        
+        # Keyed on the exact text that gets encoded
+        key = hashlib.sha256(jd_text.encode()).hexdigest()
+        
+        if key in self.jd_embedding_cache:
+            self.jd_embedding_cache.move_to_end(key)
+            return self.jd_embedding_cache[key]
+        
+        jd_embedding = self.sbert_model.encode([jd_text])
+        
+        self.jd_embedding_cache[key] = jd_embedding
+        if len(self.jd_embedding_cache) > self.jd_embedding_cache_size:
+            self.jd_embedding_cache.popitem(last=False)
+        
+        return jd_embedding
+    
     def compute_sbert_similarity(self, resume_text: str, jd_text: str) -> float:
         """Compute semantic similarity using SBERT embeddings"""
         
@@ -262,7 +307,7 @@ class ATSScorerService:
         try:
             # Generate embeddings
             resume_embedding = self.sbert_model.encode([resume_text])
-            jd_embedding = self.sbert_model.encode([jd_text])
+            jd_embedding = self.get_jd_embedding(jd_text)
             
             # Compute cosine similarity
             similarity = cosine_similarity(resume_embedding, jd_embedding)[0][0]
@@ -273,12 +318,33 @@ class ATSScorerService:
             logger.error(f"SBERT similarity computation failed: {e}")
             return 0.0
     
+    def compute_sbert_similarities(self, resume_texts: List[str], jd_text: str) -> List[float]:
+        """Compute semantic similarity of several resumes to one job description in a single encoder pass"""
+        
+        if not self.sbert_model:
+            logger.warning("SBERT model not available")
+            return [0.0] * len(resume_texts)
+            
+        try:
+            # Encode all resumes together; the job description embedding is cached
+            resume_embeddings = self.sbert_model.encode(resume_texts)
+            jd_embedding = self.get_jd_embedding(jd_text)
+            
+            # Compute cosine similarity of every resume against the job description
+            similarities = cosine_similarity(resume_embeddings, jd_embedding)[:, 0]
+            
+            return [max(0.0, min(1.0, float(similarity))) for similarity in similarities]
+            
+        except Exception as e:
+            logger.error(f"Batch SBERT similarity computation failed: {e}")
+            return [0.0] * len(resume_texts)
+    
     def analyze_keyword_match(self, resume_text: str, jd_text: str) -> Tuple[List[str], List[str], float]:
         """Analyze keyword matches between resume and job description"""
         
         # Extract keywords from both texts
         resume_keywords = set(self.extract_keywords_from_text(resume_text, top_n=100))
-        jd_keywords = set(self.extract_keywords_from_text(jd_text, top_n=100))
+        jd_keywords = set(self.extract_jd_keywords(jd_text, top_n=100))
         
         # Find matches
         matched_keywords = list(resume_keywords & jd_keywords)
@@ -326,7 +392,7 @@ class ATSScorerService:
         
         elif section_type == 'experience':
             # Experience section gets bonus for impact words and metrics
-            impact_count = sum(1 for word in self.impact_words if word in resume_section.lower())
+            impact_count = self.count_impact_words(resume_section)
             metrics_count = sum(1 for pattern in self.metrics_patterns if re.search(pattern, resume_section))
             
             impact_boost = min(0.2, impact_count * 0.02)  # Max 20% boost
@@ -362,7 +428,8 @@ class ATSScorerService:
             return feedback
     
     async def score_resume(self, parsed_resume: Dict[str, Any], job_description: str, 
-                          use_sbert: bool = False, custom_weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+                          use_sbert: bool = False, custom_weights: Optional[Dict[str, float]] = None,
+                          overall_similarity: Optional[float] = None) -> Dict[str, Any]:
         """Main method to score resume against job description"""
         
         try:
@@ -379,9 +446,11 @@ class ATSScorerService:
             # Combine all resume text
             full_resume_text = parsed_resume.get('raw_text', '')
             
-            # Compute overall similarity
+            # Compute overall similarity (unless precomputed by a batch call)
             if use_sbert:
-                overall_score = self.compute_sbert_similarity(full_resume_text, job_description)
+                if overall_similarity is None:
+                    overall_similarity = self.compute_sbert_similarity(full_resume_text, job_description)
+                overall_score = overall_similarity
                 scoring_method = "sbert"
             else:
                 overall_score = self.compute_tfidf_similarity(full_resume_text, job_description)
@@ -426,6 +495,25 @@ class ATSScorerService:
             logger.error(f"Error scoring resume: {str(e)}")
             raise
     
+    async def score_resumes_batch(self, parsed_resumes: List[Dict[str, Any]], job_description: str,
+                                  use_sbert: bool = False,
+                                  custom_weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """Score several resumes against the same job description"""
+        
+        # Encode all resumes in one SBERT pass
+        similarities = [None] * len(parsed_resumes)
+        if use_sbert:
+            similarities = self.compute_sbert_similarities(
+                [parsed_resume.get('raw_text', '') for parsed_resume in parsed_resumes],
+                job_description
+            )
+        
+        return [
+            await self.score_resume(parsed_resume, job_description, use_sbert, custom_weights,
+                                    overall_similarity=similarity)
+            for parsed_resume, similarity in zip(parsed_resumes, similarities)
+        ]
+    
     def extract_skills_text(self, skills_data: Dict[str, Any]) -> str:
         """Extract text from skills data structure"""
         skills_text = []
@@ -528,6 +616,10 @@ class ATSScorerService:
         
         return suggestions
     
+    def count_impact_words(self, text: str) -> int:
+        """Count the distinct impact words used in text"""
+        return len({word.lower() for word in self.IMPACT_RE.findall(text)})
+    
     def add_specific_suggestions(self, suggestions: List[Dict[str, Any]], parsed_resume: Dict[str, Any], score_data: Dict[str, Any]):
         """Add specific, actionable suggestions"""
         
@@ -535,7 +627,7 @@ class ATSScorerService:
         experience_text = self.extract_experience_text(parsed_resume.get('experience', []))
         
         metrics_count = sum(1 for pattern in self.metrics_patterns if re.search(pattern, experience_text))
-        impact_count = sum(1 for word in self.impact_words if word in experience_text.lower())
+        impact_count = self.count_impact_words(experience_text)
         
         if metrics_count < 2:
             suggestions.append({
@@ -37,6 +37,119 @@ logger = logging.getLogger(__name__)
 class ResumeParserService:
     """Service for parsing PDF resumes and extracting structured information"""
     
+    # Email pattern
+    EMAIL_PATTERN = re.compile(
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    )
+    
+    # Phone patterns (various formats)
+    PHONE_PATTERN = re.compile('|'.join([
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
+        r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
+        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # 123 456 7890
+    ]))
+    
+    # LinkedIn pattern
+    LINKEDIN_PATTERN = re.compile(
+        r'(?:linkedin\.com/in/|linkedin\.com/pub/)([A-Za-z0-9\-_%]+)',
+        re.IGNORECASE
+    )
+    
+    # GitHub pattern
+    GITHUB_PATTERN = re.compile(
+        r'(?:github\.com/)([A-Za-z0-9\-_.]+)',
+        re.IGNORECASE
+    )
+    
+    # Location pattern (heuristic: city, state)
+    LOCATION_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}(?:\s+\d{5})?)', re.IGNORECASE)
+    
+    # Section headers
+    SECTION_PATTERNS = {
+        'education': re.compile(r'\b(?:education|academic|qualification|degree|university|college)\b', re.IGNORECASE),
+        'experience': re.compile(r'\b(?:experience|employment|work|professional|career|job)\b', re.IGNORECASE),
+        'skills': re.compile(r'\b(?:skills|technical|technologies|competencies|expertise)\b', re.IGNORECASE),
+        'projects': re.compile(r'\b(?:projects|portfolio|work samples)\b', re.IGNORECASE),
+        'certifications': re.compile(r'\b(?:certifications|certificates|licenses)\b', re.IGNORECASE),
+    }
+    
+    # Date patterns
+    DATE_PATTERNS = (
+        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}\b',
+        r'\b\d{1,2}/\d{4}\b',
+        r'\b\d{4}\b',
+        r'\b(?:Present|Current|Now)\b'
+    )
+    DATE_PATTERN = re.compile('|'.join(DATE_PATTERNS), re.IGNORECASE)
+    
+    # GPA pattern
+    GPA_PATTERN = re.compile(r'(?:GPA|Grade|CGPA)[:.]?\s*(\d+\.?\d*)', re.IGNORECASE)
+    
+    # Degree patterns
+    DEGREE_PATTERNS = (
+        r'\b(?:Bachelor|BS|BA|B\.S\.|B\.A\.)\b',
+        r'\b(?:Master|MS|MA|M\.S\.|M\.A\.|MBA)\b',
+        r'\b(?:PhD|Ph\.D\.|Doctorate|Ph\.D)\b',
+        r'\b(?:Associate|AS|AA|A\.S\.|A\.A\.)\b'
+    )
+    DEGREE_PATTERN = re.compile('|'.join(DEGREE_PATTERNS), re.IGNORECASE)
+    
+    # Whitespace normalization and common OCR/extraction fixes, applied in order
+    CLEANUP_SUBSTITUTIONS = (
+        (re.compile(r'\n+'), '\n'),
+        (re.compile(r'\t+'), ' '),
+        (re.compile(r' +'), ' '),
+        (re.compile(r'([a-z])([A-Z])'), r'\1 \2'),  # Add space between camelCase
+        (re.compile(r'([a-zA-Z])(\d)'), r'\1 \2'),  # Add space before numbers
+        (re.compile(r'(\d)([a-zA-Z])'), r'\1 \2'),  # Add space after numbers
+        (re.compile(r'-\s*\n\s*'), ''),  # Remove hyphenation at line breaks
+    )
+    
+    # Header/footer patterns (common resume artifacts)
+    HEADER_FOOTER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Page \d+ of \d+',
+        r'\d+/\d+',
+        r'Resume of .+',
+        r'.+\s+Resume',
+        r'Confidential',
+        r'DRAFT',
+    ))
+    
+    # Technical skills categorized
+    TECHNICAL_SKILLS = {
+        'programming_languages': [
+            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust',
+            'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'bash',
+            'powershell', 'sql', 'html', 'css', 'xml', 'json'
+        ],
+        'frameworks': [
+            'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask', 'fastapi',
+            'spring', 'hibernate', 'struts', 'laravel', 'rails', 'asp.net', 'blazor',
+            'xamarin', 'flutter', 'react native', 'ionic', 'cordova'
+        ],
+        'databases': [
+            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'sqlite',
+            'oracle', 'sql server', 'cassandra', 'dynamodb', 'firebase', 'couchdb'
+        ],
+        'cloud_platforms': [
+            'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 'linode',
+            'vultr', 'cloudflare', 'vercel', 'netlify'
+        ],
+        'tools': [
+            'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'bitbucket',
+            'jira', 'confluence', 'slack', 'teams', 'zoom', 'figma', 'sketch',
+            'photoshop', 'illustrator', 'indesign'
+        ],
+        'data_science': [
+            'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+            'matplotlib', 'seaborn', 'plotly', 'jupyter', 'tableau', 'power bi',
+            'excel', 'spss', 'sas', 'stata'
+        ]
+    }
+    
+    # Flatten all technical skills, keeping category order for stable output
+    ALL_TECHNICAL_SKILLS = tuple(skill for skills in TECHNICAL_SKILLS.values() for skill in skills)
+    
     def __init__(self):
         self.setup_nlp()
         self.setup_patterns()
@@ -66,100 +179,24 @@ class ResumeParserService:
     def setup_patterns(self):
         """Setup regex patterns for information extraction"""
         
-        # Email pattern
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        )
-        
-        # Phone patterns (various formats)
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
-            r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # 123 456 7890
-        ]
-        self.phone_pattern = re.compile('|'.join(phone_patterns))
-        
-        # LinkedIn pattern
-        self.linkedin_pattern = re.compile(
-            r'(?:linkedin\.com/in/|linkedin\.com/pub/)([A-Za-z0-9\-_%]+)',
-            re.IGNORECASE
-        )
-        
-        # GitHub pattern
-        self.github_pattern = re.compile(
-            r'(?:github\.com/)([A-Za-z0-9\-_.]+)',
-            re.IGNORECASE
-        )
-        
-        # Section headers
-        self.section_patterns = {
-            'education': re.compile(r'\b(?:education|academic|qualification|degree|university|college)\b', re.IGNORECASE),
-            'experience': re.compile(r'\b(?:experience|employment|work|professional|career|job)\b', re.IGNORECASE),
-            'skills': re.compile(r'\b(?:skills|technical|technologies|competencies|expertise)\b', re.IGNORECASE),
-            'projects': re.compile(r'\b(?:projects|portfolio|work samples)\b', re.IGNORECASE),
-            'certifications': re.compile(r'\b(?:certifications|certificates|licenses)\b', re.IGNORECASE),
-        }
-        
-        # Date patterns
-        self.date_patterns = [
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}\b',
-            r'\b\d{1,2}/\d{4}\b',
-            r'\b\d{4}\b',
-            r'\b(?:Present|Current|Now)\b'
-        ]
-        self.date_pattern = re.compile('|'.join(self.date_patterns), re.IGNORECASE)
-        
-        # GPA pattern
-        self.gpa_pattern = re.compile(r'(?:GPA|Grade|CGPA)[:.]?\s*(\d+\.?\d*)', re.IGNORECASE)
-        
-        # Degree patterns
-        self.degree_patterns = [
-            r'\b(?:Bachelor|BS|BA|B\.S\.|B\.A\.)\b',
-            r'\b(?:Master|MS|MA|M\.S\.|M\.A\.|MBA)\b',
-            r'\b(?:PhD|Ph\.D\.|Doctorate|Ph\.D)\b',
-            r'\b(?:Associate|AS|AA|A\.S\.|A\.A\.)\b'
-        ]
-        self.degree_pattern = re.compile('|'.join(self.degree_patterns), re.IGNORECASE)
+        # Patterns are compiled once on the class
+        self.email_pattern = self.EMAIL_PATTERN
+        self.phone_pattern = self.PHONE_PATTERN
+        self.linkedin_pattern = self.LINKEDIN_PATTERN
+        self.github_pattern = self.GITHUB_PATTERN
+        self.section_patterns = self.SECTION_PATTERNS
+        self.date_patterns = list(self.DATE_PATTERNS)
+        self.date_pattern = self.DATE_PATTERN
+        self.gpa_pattern = self.GPA_PATTERN
+        self.degree_patterns = list(self.DEGREE_PATTERNS)
+        self.degree_pattern = self.DEGREE_PATTERN
     
     def setup_skills_database(self):
         """Setup skills database for extraction"""
         
-        # Technical skills categorized
-        self.technical_skills = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust',
-                'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'bash',
-                'powershell', 'sql', 'html', 'css', 'xml', 'json'
-            ],
-            'frameworks': [
-                'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask', 'fastapi',
-                'spring', 'hibernate', 'struts', 'laravel', 'rails', 'asp.net', 'blazor',
-                'xamarin', 'flutter', 'react native', 'ionic', 'cordova'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'sqlite',
-                'oracle', 'sql server', 'cassandra', 'dynamodb', 'firebase', 'couchdb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 'linode',
-                'vultr', 'cloudflare', 'vercel', 'netlify'
-            ],
-            'tools': [
-                'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'bitbucket',
-                'jira', 'confluence', 'slack', 'teams', 'zoom', 'figma', 'sketch',
-                'photoshop', 'illustrator', 'indesign'
-            ],
-            'data_science': [
-                'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-                'matplotlib', 'seaborn', 'plotly', 'jupyter', 'tableau', 'power bi',
-                'excel', 'spss', 'sas', 'stata'
-            ]
-        }
-        
-        # Flatten all technical skills
-        self.all_technical_skills = []
-        for category, skills in self.technical_skills.items():
-            self.all_technical_skills.extend(skills)
+        # Technical skills categorized (built once per process on the class)
+        self.technical_skills = self.TECHNICAL_SKILLS
+        self.all_technical_skills = self.ALL_TECHNICAL_SKILLS
         
         # Soft skills
         self.soft_skills = [
@@ -243,31 +280,13 @@ class ResumeParserService:
     def clean_extracted_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
         
-        # Remove extra whitespace and normalize line breaks
-        text = re.sub(r'\n+', '\n', text)
-        text = re.sub(r'\t+', ' ', text)
-        text = re.sub(r' +', ' ', text)
-        
-        # Fix common OCR/extraction issues
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Add space between camelCase
-        text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', text)  # Add space before numbers
-        text = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', text)  # Add space after numbers
-        
-        # Fix hyphenation issues
-        text = re.sub(r'-\s*\n\s*', '', text)  # Remove hyphenation at line breaks
+        # Normalize whitespace and fix common OCR/extraction issues
+        for pattern, replacement in self.CLEANUP_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
         
         # Remove header/footer patterns (common resume artifacts)
-        header_footer_patterns = [
-            r'Page \d+ of \d+',
-            r'\d+/\d+',
-            r'Resume of .+',
-            r'.+\s+Resume',
-            r'Confidential',
-            r'DRAFT',
-        ]
-        
-        for pattern in header_footer_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for pattern in self.HEADER_FOOTER_PATTERNS:
+            text = pattern.sub('', text)
             
         return text.strip()
 
@@ -392,8 +411,7 @@ class ResumeParserService:
                     break
         
         # Extract location (heuristic: city, state pattern)
-        location_pattern = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}(?:\s+\d{5})?)', re.IGNORECASE)
-        location_match = location_pattern.search(text)
+        location_match = self.LOCATION_PATTERN.search(text)
         if location_match:
             contact_info['location'] = location_match.group().strip()
         
@@ -44,6 +44,21 @@ st.markdown("""
     .score-excellent { color: #28a745; font-weight: bold; }
     .score-good { color: #ffc107; font-weight: bold; }
     .score-poor { color: #dc3545; font-weight: bold; }
+    .keyword-chip {
+        display: inline-block;
+        padding: 0.15rem 0.6rem;
+        margin: 0.15rem;
+        border-radius: 1rem;
+        font-size: 0.9rem;
+    }
+    .keyword-chip.matched { background: #d4edda; color: #155724; }
+    .keyword-chip.missing { background: #f8d7da; color: #721c24; }
+    .resume-card-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 0 1rem;
+    }
+    .resume-card p { margin: 0 0 0.5rem 0; }
     .sidebar-header {
         font-size: 1.5rem;
         color: #333;
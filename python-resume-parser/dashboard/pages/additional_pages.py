@@ -9,6 +9,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List, Optional
 
+from services.api import clear_job_description_cache, clear_resume_cache
+
 def show_upload_job_description():
     """Job description upload and management page"""
     
@@ -60,6 +62,7 @@ def save_job_description(title: str, company: str, description: str):
         if response.status_code == 200:
             result = response.json()
             st.success(f"✅ Job description '{title}' saved successfully!")
+            clear_job_description_cache()
             st.rerun()  # Refresh to show in the list
         else:
             st.error(f"❌ Failed to save job description: {response.text}")
@@ -274,6 +277,7 @@ def reparse_resume(resume_id: str):
             
             if response.status_code == 200:
                 st.success("✅ Resume reparsed successfully!")
+                clear_resume_cache()
                 st.rerun()
             else:
                 st.error(f"❌ Failed to reparse: {response.text}")
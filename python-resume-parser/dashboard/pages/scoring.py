@@ -3,12 +3,13 @@ ATS Scoring page functionality
 """
 
 import streamlit as st
-import requests
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
-from typing import Dict, List, Optional
+import html
+from typing import Dict, List, Optional, Tuple
+
+from services.api import (
+    SESSION, cache_result, get_api_base_url, get_available_resumes, get_cached_result,
+    get_saved_job_descriptions, payload_key, submit_fetch
+)
 
 def show_ats_scoring():
     """ATS scoring page"""
@@ -16,89 +17,89 @@ def show_ats_scoring():
     st.header("📊 ATS Scoring")
     st.markdown("Score resumes against job descriptions using AI-powered ATS algorithms.")
     
-    # Get list of available resumes
-    resumes = get_available_resumes()
+    base_url = get_api_base_url()
+    
+    # Fetch resumes and saved job descriptions concurrently
+    fut_resumes = submit_fetch(get_available_resumes, base_url)
+    fut_jds = submit_fetch(get_saved_job_descriptions, base_url)
+    resumes = fut_resumes.result()
+    saved_jds = fut_jds.result()
     
     if not resumes:
         st.warning("No resumes available. Please upload a resume first.")
         return
     
-    # Resume selection
+    # Layout toggles stay outside the form so they take effect immediately
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Create resume options
-        resume_options = {
-            f"{r.get('name', 'Unknown')} ({r['filename']})": r['id']
-            for r in resumes
-        }
-        
-        selected_resume_display = st.selectbox(
-            "Select Resume to Score",
-            options=list(resume_options.keys())
+        # Option to use saved JD or input new one
+        use_saved_jd = st.radio(
+            "Job Description Source",
+            ["Enter New", "Use Saved"],
+            horizontal=True
         )
-        
-        selected_resume_id = resume_options[selected_resume_display]
     
     with col2:
-        # Scoring options
-        use_sbert = st.checkbox(
-            "Use SBERT (Advanced)",
-            help="Use Sentence-BERT for enhanced semantic scoring"
-        )
-        
         custom_weights = st.checkbox(
             "Custom Weights",
             help="Customize section scoring weights"
         )
     
-    # Custom weights configuration
-    if custom_weights:
-        st.subheader("⚖️ Scoring Weights")
-        col1, col2, col3 = st.columns(3)
+    if use_saved_jd == "Use Saved" and not saved_jds:
+        st.info("No saved job descriptions available.")
+        use_saved_jd = "Enter New"
+    
+    # Collect the remaining inputs in a form so editing them doesn't rerun the page
+    with st.form("ats_form"):
+        
+        # Resume selection
+        col1, col2 = st.columns([2, 1])
         
         with col1:
-            skills_weight = st.slider("Skills Weight", 0.0, 1.0, 0.4, 0.05)
+            # Create resume options
+            resume_options = {
+                f"{r.get('name', 'Unknown')} ({r['filename']})": r['id']
+                for r in resumes
+            }
+            
+            selected_resume_displays = st.multiselect(
+                "Select Resumes to Score",
+                options=list(resume_options.keys()),
+                default=list(resume_options.keys())[:1],
+                help="Select several resumes to compare them against the same job description"
+            )
+            
+            selected_resume_ids = [resume_options[display] for display in selected_resume_displays]
+            resume_labels = {resume_id: display for display, resume_id in resume_options.items()}
+        
         with col2:
-            experience_weight = st.slider("Experience Weight", 0.0, 1.0, 0.35, 0.05)
-        with col3:
-            education_weight = st.slider("Education Weight", 0.0, 1.0, 0.25, 0.05)
+            # Scoring options
+            use_sbert = st.checkbox(
+                "Use SBERT (Advanced)",
+                help="Use Sentence-BERT for enhanced semantic scoring"
+            )
         
-        # Normalize weights
-        total_weight = skills_weight + experience_weight + education_weight
-        if total_weight != 1.0:
-            st.warning(f"Weights sum to {total_weight:.2f}. They will be normalized to 1.0.")
-            weights = {
-                "skills": skills_weight / total_weight,
-                "experience": experience_weight / total_weight,
-                "education": education_weight / total_weight
-            }
-        else:
-            weights = {
-                "skills": skills_weight,
-                "experience": experience_weight,
-                "education": education_weight
-            }
-    else:
-        weights = None
-    
-    # Job description input
-    st.subheader("📝 Job Description")
-    
-    # Option to use saved JD or input new one
-    use_saved_jd = st.radio(
-        "Job Description Source",
-        ["Enter New", "Use Saved"],
-        horizontal=True
-    )
-    
-    job_description = ""
-    job_title = ""
-    company = ""
-    
-    if use_saved_jd == "Use Saved":
-        saved_jds = get_saved_job_descriptions()
-        if saved_jds:
+        # Custom weights configuration
+        if custom_weights:
+            st.subheader("⚖️ Scoring Weights")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                skills_weight = st.slider("Skills Weight", 0.0, 1.0, 0.4, 0.05)
+            with col2:
+                experience_weight = st.slider("Experience Weight", 0.0, 1.0, 0.35, 0.05)
+            with col3:
+                education_weight = st.slider("Education Weight", 0.0, 1.0, 0.25, 0.05)
+        
+        # Job description input
+        st.subheader("📝 Job Description")
+        
+        job_description = ""
+        job_title = ""
+        company = ""
+        
+        if use_saved_jd == "Use Saved":
             selected_jd = st.selectbox(
                 "Select Saved Job Description",
                 options=saved_jds,
@@ -108,59 +109,88 @@ def show_ats_scoring():
             job_title = selected_jd['title']
             company = selected_jd.get('company', '')
         else:
-            st.info("No saved job descriptions available.")
-            use_saved_jd = "Enter New"
-    
-    if use_saved_jd == "Enter New":
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            job_title = st.text_input("Job Title", placeholder="Software Engineer")
-        with col2:
-            company = st.text_input("Company Name", placeholder="Tech Corp")
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                job_title = st.text_input("Job Title", placeholder="Software Engineer")
+            with col2:
+                company = st.text_input("Company Name", placeholder="Tech Corp")
+            
+            job_description = st.text_area(
+                "Job Description",
+                height=200,
+                placeholder="Paste the complete job description here...",
+                help="Include requirements, responsibilities, and desired skills"
+            )
         
-        job_description = st.text_area(
-            "Job Description",
-            height=200,
-            placeholder="Paste the complete job description here...",
-            help="Include requirements, responsibilities, and desired skills"
-        )
+        # Score button
+        submitted = st.form_submit_button("🎯 Score Resume", type="primary")
     
-    # Score button
-    if st.button("🎯 Score Resume", type="primary", disabled=len(job_description) < 50):
-        if len(job_description) < 50:
-            st.error("Job description must be at least 50 characters long.")
-        else:
-            score_resume(selected_resume_id, job_description, job_title, company, use_sbert, weights)
+    if not submitted:
+        return
+    
+    if custom_weights:
+        # Normalize weights; all-zero weights can't be normalized
+        total_weight = skills_weight + experience_weight + education_weight
+        if total_weight == 0:
+            st.error("At least one section weight must be greater than 0.")
+            return
+        if abs(total_weight - 1.0) > 1e-6:
+            st.warning(f"Weights sum to {total_weight:.2f}. They will be normalized to 1.0.")
+        weights = {
+            "skills": skills_weight / total_weight,
+            "experience": experience_weight / total_weight,
+            "education": education_weight / total_weight
+        }
+    else:
+        weights = None
+    
+    jd_len = len(job_description)
+    if not selected_resume_ids:
+        st.error("Select at least one resume to score.")
+    elif jd_len < 50:
+        st.error("Job description must be at least 50 characters long.")
+    else:
+        score_resume(selected_resume_ids, job_description, job_title, company, use_sbert, weights, resume_labels, base_url)
 
-def score_resume(resume_id: str, job_description: str, job_title: str, company: str, use_sbert: bool, weights: Optional[Dict]):
-    """Score a resume against job description"""
+def score_resume(resume_ids: List[str], job_description: str, job_title: str, company: str, use_sbert: bool,
+                 weights: Optional[Dict], resume_labels: Dict[str, str], base_url: str):
+    """Score one or more resumes against job description in a single request"""
+    
+    # Prepare scoring request
+    scoring_data = {
+        "resume_ids": resume_ids,
+        "job_description": job_description,
+        "job_title": job_title or None,
+        "company": company or None,
+        "use_sbert": use_sbert
+    }
+    
+    if weights:
+        scoring_data["score_weights"] = weights
+    
+    # Reuse the result of an identical request instead of re-scoring
+    request_key = payload_key(scoring_data)
+    cached = get_cached_result('_score_cache', request_key)
+    if cached is not None:
+        display_batch_results(cached, resume_labels)
+        return
     
     with st.spinner("Analyzing resume... This may take a moment."):
         
-        # Prepare scoring request
-        scoring_data = {
-            "resume_id": resume_id,
-            "job_description": job_description,
-            "job_title": job_title or None,
-            "company": company or None,
-            "use_sbert": use_sbert
-        }
-        
-        if weights:
-            scoring_data["score_weights"] = weights
-        
         try:
             # Make scoring request
-            response = requests.post(
-                f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/score_resume",
-                json=scoring_data
+            response = SESSION.post(
+                f"{base_url}/api/v1/score_resume_batch",
+                json=scoring_data,
+                timeout=(3, 60)
             )
             
             if response.status_code == 200:
                 result = response.json()
+                cache_result('_score_cache', request_key, result)
                 
                 # Display results
-                display_scoring_results(result)
+                display_batch_results(result, resume_labels)
                 
             else:
                 st.error(f"❌ Scoring failed: {response.text}")
@@ -168,6 +198,38 @@ def score_resume(resume_id: str, job_description: str, job_title: str, company:
         except Exception as e:
             st.error(f"❌ Error during scoring: {str(e)}")
 
+def display_batch_results(batch_result: Dict, resume_labels: Dict[str, str]):
+    """Display scoring results for one or more resumes"""
+    
+    # Imported lazily so sessions that never score don't pay for pandas
+    import pandas as pd
+    
+    results = batch_result.get('results', [])
+    missing_resume_ids = batch_result.get('missing_resume_ids', [])
+    
+    if missing_resume_ids:
+        st.warning(f"Skipped {len(missing_resume_ids)} resume(s) that were not found or not parsed yet.")
+    
+    if len(results) == 1:
+        display_scoring_results(results[0])
+        return
+    
+    # Rank resumes by overall score
+    ranked = sorted(results, key=lambda r: r.get('overall_score', 0), reverse=True)
+    
+    st.subheader("🏆 Resume Comparison")
+    df_comparison = pd.DataFrame({
+        'Resume': [resume_labels.get(r['resume_id'], r['resume_id']) for r in ranked],
+        'Overall Score': [f"{r.get('overall_score', 0):.1%}" for r in ranked],
+        'Keyword Match': [f"{r.get('keyword_density', 0):.1%}" for r in ranked]
+    })
+    st.dataframe(df_comparison, use_container_width=True)
+    
+    for i, result in enumerate(ranked):
+        label = resume_labels.get(result['resume_id'], result['resume_id'])
+        with st.expander(f"{label} - {result.get('overall_score', 0):.1%}", expanded=i == 0):
+            display_scoring_results(result)
+
 def display_scoring_results(result: Dict):
     """Display scoring results with visualizations"""
     
@@ -219,39 +281,45 @@ def display_scoring_results(result: Dict):
     else:
         st.error("❌ Poor match. Major revisions needed for better ATS compatibility.")
     
-    # Section Scores Visualization
-    st.subheader("📊 Section Breakdown")
-    
+    # Section Scores Visualization (skipped entirely when there is nothing to chart)
     section_scores = result.get('section_scores', [])
     if section_scores:
+        import pandas as pd
+        
+        st.subheader("📊 Section Breakdown")
+        
         # Create radar chart for section scores
         fig = create_section_scores_chart(section_scores)
         st.plotly_chart(fig, use_container_width=True)
         
-        # Section details table
-        df_sections = pd.DataFrame([
-            {
-                'Section': section['section'].title(),
-                'Score': f"{section['score']:.1%}",
-                'Weight': f"{section['weight']:.1%}",
-                'Matched Keywords': len(section.get('matched_keywords', [])),
-                'Missing Keywords': len(section.get('missing_keywords', []))
-            }
-            for section in section_scores
-        ])
+        # Section details table, built column-wise in a single pass
+        columns = {
+            'Section': [],
+            'Score': [],
+            'Weight': [],
+            'Matched Keywords': [],
+            'Missing Keywords': []
+        }
+        for section in section_scores:
+            columns['Section'].append(section['section'].title())
+            columns['Score'].append(f"{section['score']:.1%}")
+            columns['Weight'].append(f"{section['weight']:.1%}")
+            columns['Matched Keywords'].append(len(section.get('matched_keywords', [])))
+            columns['Missing Keywords'].append(len(section.get('missing_keywords', [])))
+        df_sections = pd.DataFrame(columns)
         
         st.dataframe(df_sections, use_container_width=True)
     
     # Keywords Analysis
+    matched_html, missing_html = get_keyword_chips(result)
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("✅ Matched Keywords")
         matched = result.get('total_matched_keywords', [])
         if matched:
-            # Display as tags
-            matched_text = " • ".join(matched[:20])  # Show first 20
-            st.success(matched_text)
+            # Display as tags (first 20)
+            st.markdown(matched_html, unsafe_allow_html=True)
             if len(matched) > 20:
                 st.info(f"... and {len(matched) - 20} more")
         else:
@@ -261,8 +329,7 @@ def display_scoring_results(result: Dict):
         st.subheader("❌ Missing Keywords")
         missing = result.get('total_missing_keywords', [])
         if missing:
-            missing_text = " • ".join(missing[:20])  # Show first 20
-            st.error(missing_text)
+            st.markdown(missing_html, unsafe_allow_html=True)
             if len(missing) > 20:
                 st.info(f"... and {len(missing) - 20} more")
         else:
@@ -273,28 +340,49 @@ def display_scoring_results(result: Dict):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("💡 Get Improvement Suggestions"):
+        if st.button("💡 Get Improvement Suggestions", key=f"suggest_{result['resume_id']}"):
             st.session_state['current_resume_id'] = result['resume_id']
             st.session_state['current_job_description'] = result.get('job_description', '')
             st.session_state['page'] = "💡 Suggestions"
             st.rerun()
     
     with col2:
-        if st.button("📄 View Full Resume"):
+        if st.button("📄 View Full Resume", key=f"view_{result['resume_id']}"):
             st.session_state['current_resume_id'] = result['resume_id']
             st.session_state['page'] = "🔍 Resume Viewer"
             st.rerun()
     
     with col3:
-        if st.button("📊 Score Another Resume"):
+        if st.button("📊 Score Another Resume", key=f"rescore_{result['resume_id']}"):
             st.rerun()
 
+def keyword_chips_html(keywords: List[str], css_class: str) -> str:
+    """Render up to 20 keywords as HTML chips"""
+    
+    return " ".join(
+        f"<span class='keyword-chip {css_class}'>{html.escape(keyword)}</span>"
+        for keyword in keywords[:20]
+    )
+
+def get_keyword_chips(result: Dict) -> Tuple[str, str]:
+    """Get matched/missing keyword chips for a result, rendered once per scoring"""
+    
+    key = f"{result['resume_id']}:{result.get('score_id')}"
+    chips = get_cached_result('_keyword_chips', key)
+    if chips is None:
+        chips = (
+            keyword_chips_html(result.get('total_matched_keywords', []), 'matched'),
+            keyword_chips_html(result.get('total_missing_keywords', []), 'missing')
+        )
+        cache_result('_keyword_chips', key, chips)
+    return chips
+
 def create_section_scores_chart(section_scores: List[Dict]):
     """Create radar chart for section scores"""
     
-    sections = [s['section'].title() for s in section_scores]
-    scores = [s['score'] for s in section_scores]
-    weights = [s['weight'] for s in section_scores]
+    import plotly.graph_objects as go
+    
+    sections, scores = zip(*((s['section'].title(), s['score']) for s in section_scores)) if section_scores else ((), ())
     
     fig = go.Figure()
     
@@ -329,37 +417,4 @@ def create_section_scores_chart(section_scores: List[Dict]):
         height=500
     )
     
-    return fig
-
-def get_available_resumes() -> List[Dict]:
-    """Get list of available resumes"""
-    
-    try:
-        response = requests.get(
-            f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/resumes?page_size=50"
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('resumes', [])
-        else:
-            return []
-            
-    except Exception:
-        return []
-
-def get_saved_job_descriptions() -> List[Dict]:
-    """Get saved job descriptions"""
-    
-    try:
-        response = requests.get(
-            f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/job-descriptions"
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return []
-            
-    except Exception:
-        return []
\ No newline at end of file
+    return fig
\ No newline at end of file
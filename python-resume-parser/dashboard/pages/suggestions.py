@@ -3,77 +3,95 @@ Resume improvement suggestions page
 """
 
 import streamlit as st
-import requests
-import plotly.express as px
 from typing import Dict, List
 
+from services.api import (
+    SESSION, cache_result, get_api_base_url, get_available_resumes, get_cached_result, payload_key
+)
+
 def show_suggestions():
     """Resume suggestions page"""
     
     st.header("💡 Resume Improvement Suggestions")
     st.markdown("Get AI-powered suggestions to improve your resume's ATS compatibility.")
     
+    base_url = get_api_base_url()
+    
     # Get current resume ID from session state or let user select
     current_resume_id = st.session_state.get('current_resume_id')
     
-    if not current_resume_id:
-        # Let user select a resume
-        resumes = get_available_resumes()
-        if not resumes:
-            st.warning("No resumes available. Please upload a resume first.")
-            return
+    resumes = [] if current_resume_id else get_available_resumes(base_url)
+    if not current_resume_id and not resumes:
+        st.warning("No resumes available. Please upload a resume first.")
+        return
+    
+    # Collect inputs in a form so typing the job description doesn't rerun the page
+    with st.form("suggestions_form"):
         
-        resume_options = {
-            f"{r.get('name', 'Unknown')} ({r['filename']})": r['id']
-            for r in resumes
-        }
+        if not current_resume_id:
+            # Let user select a resume
+            resume_options = {
+                f"{r.get('name', 'Unknown')} ({r['filename']})": r['id']
+                for r in resumes
+            }
+            
+            selected_resume_display = st.selectbox(
+                "Select Resume for Suggestions",
+                options=list(resume_options.keys())
+            )
+            
+            current_resume_id = resume_options[selected_resume_display]
+        
+        # Job description input
+        st.subheader("📝 Job Description")
         
-        selected_resume_display = st.selectbox(
-            "Select Resume for Suggestions",
-            options=list(resume_options.keys())
+        # Check if we have a job description from previous scoring
+        current_jd = st.session_state.get('current_job_description', '')
+        
+        job_description = st.text_area(
+            "Job Description",
+            value=current_jd,
+            height=200,
+            placeholder="Paste the job description here to get targeted suggestions..."
         )
         
-        current_resume_id = resume_options[selected_resume_display]
-    
-    # Job description input
-    st.subheader("📝 Job Description")
-    
-    # Check if we have a job description from previous scoring
-    current_jd = st.session_state.get('current_job_description', '')
+        # Generate suggestions button
+        submitted = st.form_submit_button("🧠 Generate Suggestions", type="primary")
     
-    job_description = st.text_area(
-        "Job Description",
-        value=current_jd,
-        height=200,
-        placeholder="Paste the job description here to get targeted suggestions..."
-    )
-    
-    # Generate suggestions button
-    if st.button("🧠 Generate Suggestions", type="primary", disabled=len(job_description) < 50):
+    if submitted:
         if len(job_description) < 50:
             st.error("Please provide a job description (at least 50 characters)")
         else:
-            generate_suggestions(current_resume_id, job_description)
+            generate_suggestions(current_resume_id, job_description, base_url)
 
-def generate_suggestions(resume_id: str, job_description: str):
+def generate_suggestions(resume_id: str, job_description: str, base_url: str):
     """Generate and display suggestions"""
     
+    # Prepare request
+    request_data = {
+        "resume_id": resume_id,
+        "job_description": job_description
+    }
+    
+    # Reuse the result of an identical request instead of regenerating
+    request_key = payload_key(request_data)
+    cached = get_cached_result('_suggestions_cache', request_key)
+    if cached is not None:
+        display_suggestions(cached)
+        return
+    
     with st.spinner("Analyzing resume and generating suggestions..."):
         
-        # Prepare request
-        request_data = {
-            "resume_id": resume_id,
-            "job_description": job_description
-        }
-        
         try:
-            response = requests.post(
-                f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/suggestions",
-                json=request_data
+            response = SESSION.post(
+                f"{base_url}/api/v1/suggestions",
+                json=request_data,
+                timeout=(3, 60)
             )
             
             if response.status_code == 200:
                 result = response.json()
+                cache_result('_suggestions_cache', request_key, result)
                 display_suggestions(result)
             else:
                 st.error(f"❌ Failed to generate suggestions: {response.text}")
@@ -113,8 +131,13 @@ def display_suggestions(result: Dict):
             result.get('low_priority_count', 0)
         )
     
+    suggestions = result.get('suggestions', [])
+    
     # Priority distribution chart
-    if result.get('total_suggestions', 0) > 0:
+    if suggestions:
+        # Imported lazily so sessions that never chart suggestions don't pay for plotly
+        import plotly.express as px
+        
         priority_data = {
             'Priority': ['High', 'Medium', 'Low'],
             'Count': [
@@ -157,47 +180,54 @@ def display_suggestions(result: Dict):
                 for issue in formatting_issues:
                     st.write(f"• {issue}")
     
+    # Nothing further to render without detailed suggestions
+    if not suggestions:
+        st.info("No detailed suggestions generated.")
+        return
+    
     # Detailed Suggestions
-    suggestions = result.get('suggestions', [])
+    buckets = bucket_by_priority(suggestions)
     
-    if suggestions:
-        st.subheader("📋 Detailed Suggestions")
-        
-        # Group suggestions by priority
-        high_priority = [s for s in suggestions if s['priority'] == 'high']
-        medium_priority = [s for s in suggestions if s['priority'] == 'medium']
-        low_priority = [s for s in suggestions if s['priority'] == 'low']
-        
-        # High Priority Suggestions
-        if high_priority:
-            with st.expander("🔴 High Priority Suggestions", expanded=True):
-                for i, suggestion in enumerate(high_priority, 1):
-                    display_suggestion_card(suggestion, i, "🔴")
-        
-        # Medium Priority Suggestions  
-        if medium_priority:
-            with st.expander("🟡 Medium Priority Suggestions", expanded=True):
-                for i, suggestion in enumerate(medium_priority, 1):
-                    display_suggestion_card(suggestion, i, "🟡")
-        
-        # Low Priority Suggestions
-        if low_priority:
-            with st.expander("🟢 Low Priority Suggestions", expanded=False):
-                for i, suggestion in enumerate(low_priority, 1):
-                    display_suggestion_card(suggestion, i, "🟢")
+    st.subheader("📋 Detailed Suggestions")
+    
+    # Group suggestions by priority
+    high_priority = buckets['high']
+    medium_priority = buckets['medium']
+    low_priority = buckets['low']
+    
+    # High Priority Suggestions
+    if high_priority:
+        with st.expander("🔴 High Priority Suggestions", expanded=True):
+            for i, suggestion in enumerate(high_priority, 1):
+                display_suggestion_card(suggestion, i, "🔴")
+    
+    # Medium Priority Suggestions  
+    if medium_priority:
+        with st.expander("🟡 Medium Priority Suggestions", expanded=True):
+            for i, suggestion in enumerate(medium_priority, 1):
+                display_suggestion_card(suggestion, i, "🟡")
+    
+    # Low Priority Suggestions
+    if low_priority:
+        with st.expander("🟢 Low Priority Suggestions", expanded=False):
+            for i, suggestion in enumerate(low_priority, 1):
+                display_suggestion_card(suggestion, i, "🟢")
     
     # Action Plan
     st.subheader("📋 Action Plan")
     
-    action_plan_text = generate_action_plan(suggestions)
+    action_plan_text = generate_action_plan(
+        buckets['high'][:3],
+        buckets['medium'][:3],
+        buckets['low'][:2]
+    )
     st.markdown(action_plan_text)
     
     # Download suggestions
     if st.button("📥 Download Suggestions Report"):
-        report = generate_suggestions_report(result)
         st.download_button(
             label="Download Report",
-            data=report,
+            data=get_suggestions_report_bytes(result, buckets),
             file_name=f"resume_suggestions_{result['resume_id'][:8]}.md",
             mime="text/markdown"
         )
@@ -221,48 +251,53 @@ def display_suggestion_card(suggestion: Dict, index: int, icon: str):
         
         st.markdown("---")
 
-def generate_action_plan(suggestions: List[Dict]) -> str:
-    """Generate prioritized action plan"""
+def bucket_by_priority(suggestions: List[Dict]) -> Dict[str, List[Dict]]:
+    """Partition suggestions by priority in a single pass"""
     
-    if not suggestions:
+    buckets = {'high': [], 'medium': [], 'low': []}
+    for suggestion in suggestions:
+        buckets.setdefault(suggestion['priority'], []).append(suggestion)
+    return buckets
+
+def generate_action_plan(top_high: List[Dict], top_medium: List[Dict], top_low: List[Dict]) -> str:
+    """Generate prioritized action plan from the top suggestions of each priority"""
+    
+    if not (top_high or top_medium or top_low):
         return "No specific actions needed at this time."
     
-    plan = """
+    parts = ["""
     ## 🎯 Recommended Action Plan
     
     Follow these steps in order for maximum impact:
     
     ### Phase 1: Critical Fixes (Do First)
-    """
+    """]
     
-    high_priority = [s for s in suggestions if s['priority'] == 'high']
-    for i, suggestion in enumerate(high_priority[:3], 1):
-        plan += f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}..."
+    for i, suggestion in enumerate(top_high, 1):
+        parts.append(f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}...")
     
-    plan += """
+    parts.append("""
     
     ### Phase 2: Important Improvements (Do Next)
-    """
+    """)
     
-    medium_priority = [s for s in suggestions if s['priority'] == 'medium']
-    for i, suggestion in enumerate(medium_priority[:3], 1):
-        plan += f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}..."
+    for i, suggestion in enumerate(top_medium, 1):
+        parts.append(f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}...")
     
-    plan += """
+    parts.append("""
     
     ### Phase 3: Nice-to-Have Enhancements (Time Permitting)
-    """
+    """)
     
-    low_priority = [s for s in suggestions if s['priority'] == 'low']
-    for i, suggestion in enumerate(low_priority[:2], 1):
-        plan += f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}..."
+    for i, suggestion in enumerate(top_low, 1):
+        parts.append(f"\n{i}. **{suggestion['title']}** - {suggestion['description'][:100]}...")
     
-    return plan
+    return "".join(parts)
 
-def generate_suggestions_report(result: Dict) -> str:
+def generate_suggestions_report(result: Dict, buckets: Dict[str, List[Dict]]) -> str:
     """Generate downloadable suggestions report"""
     
-    report = f"""
+    parts = [f"""
 # Resume Improvement Suggestions Report
 
 **Resume ID:** {result['resume_id']}
@@ -285,39 +320,30 @@ def generate_suggestions_report(result: Dict) -> str:
 
 ## Detailed Suggestions
 
-"""
-    
-    suggestions = result.get('suggestions', [])
+"""]
     
     for priority in ['high', 'medium', 'low']:
-        priority_suggestions = [s for s in suggestions if s['priority'] == priority]
+        priority_suggestions = buckets.get(priority, [])
         if priority_suggestions:
-            report += f"\n### {priority.title()} Priority\n\n"
+            parts.append(f"\n### {priority.title()} Priority\n\n")
             
             for i, suggestion in enumerate(priority_suggestions, 1):
-                report += f"**{i}. {suggestion['title']}**\n\n"
-                report += f"{suggestion['description']}\n\n"
+                parts.append(f"**{i}. {suggestion['title']}**\n\n")
+                parts.append(f"{suggestion['description']}\n\n")
                 
                 if suggestion.get('keywords_to_add'):
-                    report += f"*Keywords to add: {', '.join(suggestion['keywords_to_add'])}*\n\n"
+                    parts.append(f"*Keywords to add: {', '.join(suggestion['keywords_to_add'])}*\n\n")
                 
-                report += "---\n\n"
+                parts.append("---\n\n")
     
-    return report
+    return "".join(parts)
 
-def get_available_resumes() -> List[Dict]:
-    """Get list of available resumes"""
-    
-    try:
-        response = requests.get(
-            f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/resumes?page_size=50"
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('resumes', [])
-        else:
-            return []
-            
-    except Exception:
-        return []
\ No newline at end of file
+def get_suggestions_report_bytes(result: Dict, buckets: Dict[str, List[Dict]]) -> bytes:
+    """Get the encoded suggestions report, built once per generated result"""
+    
+    key = f"{result['resume_id']}:{result.get('created_at')}"
+    report = get_cached_result('_suggestions_reports', key)
+    if report is None:
+        report = generate_suggestions_report(result, buckets).encode('utf-8')
+        cache_result('_suggestions_reports', key, report)
+    return report
\ No newline at end of file
@@ -4,15 +4,187 @@ Resume upload page functionality
 
 import streamlit as st
 import requests
-from typing import Dict, Optional
+import hashlib
+import html
+import orjson
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple, Union
 import time
 
+from services.api import SESSION, clear_resume_cache, get_api_base_url, get_recent_resumes, submit_fetch
+
+# Number of parsed results kept per session for re-uploaded files
+PARSE_CACHE_SIZE = 32
+
+# Longest raw text sent to the browser in the raw text viewer
+RAW_TEXT_DISPLAY_LIMIT = 200_000
+
+# Largest upload the backend accepts (its MAX_FILE_SIZE default)
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Seconds to wait for a parse response; OCR of scanned PDFs can take minutes
+PARSE_READ_TIMEOUT = int(os.getenv("PARSE_READ_TIMEOUT", "180"))
+
+@st.cache_data(show_spinner=False)
+def join_skills(skills: Tuple[str, ...]) -> str:
+    """Comma-join a skill list once per distinct list rather than on every rerun"""
+    
+    return ", ".join(skills)
+
+def escape(value) -> str:
+    """HTML-escape a parsed field for the resume cards"""
+    
+    return html.escape(str(value))
+
+def contact_card_html(contact: Dict) -> str:
+    """Render contact details as one HTML block"""
+    
+    parts = [
+        '<div class="resume-card resume-card-grid">',
+        f"<p><b>Name:</b> {escape(contact.get('name', 'Not found'))}</p>",
+        f"<p><b>Phone:</b> {escape(contact.get('phone', 'Not found'))}</p>",
+        f"<p><b>Email:</b> {escape(contact.get('email', 'Not found'))}</p>",
+        f"<p><b>Location:</b> {escape(contact.get('location', 'Not found'))}</p>",
+        '</div>'
+    ]
+    if contact.get('linkedin'):
+        parts.append(f"<div class=\"resume-card\"><p><b>LinkedIn:</b> {escape(contact['linkedin'])}</p></div>")
+    return "".join(parts)
+
+def skills_card_html(skills: Dict) -> str:
+    """Render skill lists as one HTML block"""
+    
+    parts = ['<div class="resume-card">']
+    for key, label in (('technical', 'Technical Skills'), ('soft', 'Soft Skills'), ('certifications', 'Certifications')):
+        if skills.get(key):
+            parts.append(f"<p><b>{label}:</b><br>{escape(join_skills(tuple(skills[key])))}</p>")
+    parts.append('</div>')
+    return "".join(parts)
+
+def experience_card_html(experience: List[Dict]) -> str:
+    """Render work experience entries as one HTML block"""
+    
+    parts = ['<div class="resume-card">']
+    for i, exp in enumerate(experience, 1):
+        parts.append(f"<p><b>{i}. {escape(exp.get('title', 'Position'))} at {escape(exp.get('company', 'Company'))}</b></p>")
+        if exp.get('start_date') or exp.get('end_date'):
+            parts.append(f"<p>Duration: {escape(exp.get('start_date', ''))} - {escape(exp.get('end_date', ''))}</p>")
+        
+        for detail in (exp.get('details') or [])[:3]:  # Show first 3 details
+            parts.append(f"<p>• {escape(detail)}</p>")
+        parts.append('<hr>')
+    parts.append('</div>')
+    return "".join(parts)
+
+def education_card_html(education: List[Dict]) -> str:
+    """Render education entries as one HTML block"""
+    
+    parts = ['<div class="resume-card">']
+    for i, edu in enumerate(education, 1):
+        parts.append(f"<p><b>{i}. {escape(edu.get('degree', 'Degree'))} - {escape(edu.get('institution', 'Institution'))}</b></p>")
+        if edu.get('field_of_study'):
+            parts.append(f"<p>Field: {escape(edu['field_of_study'])}</p>")
+        if edu.get('gpa'):
+            parts.append(f"<p>GPA: {escape(edu['gpa'])}</p>")
+        if edu.get('end_date'):
+            parts.append(f"<p>Graduation: {escape(edu['end_date'])}</p>")
+        parts.append('<hr>')
+    parts.append('</div>')
+    return "".join(parts)
+
+def projects_card_html(projects: List[Dict]) -> str:
+    """Render projects as one HTML block"""
+    
+    parts = ['<div class="resume-card">']
+    for i, project in enumerate(projects, 1):
+        parts.append(f"<p><b>{i}. {escape(project.get('name', 'Project'))}</b></p>")
+        if project.get('description'):
+            parts.append(f"<p>{escape(project['description'])}</p>")
+        parts.append('<hr>')
+    parts.append('</div>')
+    return "".join(parts)
+
+def get_parse_cache() -> OrderedDict:
+    """Get the per-session LRU of parsed results keyed by file content digest"""
+    
+    return st.session_state.setdefault('parse_cache', OrderedDict())
+
+class RecentUploadsStream:
+    """Latest recent-uploads list pushed by the backend's server-sent event stream"""
+    
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.resumes: Optional[List[Dict]] = None
+        
+        # The listener only holds a weak reference, so it exits once the session drops this object
+        threading.Thread(
+            target=RecentUploadsStream._listen,
+            args=(weakref.ref(self), f"{base_url}/api/v1/resumes/stream?limit=5"),
+            daemon=True
+        ).start()
+    
+    @staticmethod
+    def _listen(stream_ref: weakref.ref, url: str):
+        """Read events into the stream object, reconnecting with backoff"""
+        
+        delay = 0.5
+        while stream_ref() is not None:
+            try:
+                # Own connection (uncompressed) so events aren't buffered or hold a pooled slot
+                with requests.get(url, stream=True, timeout=(3, 60),
+                                  headers={'Accept-Encoding': 'identity'}) as response:
+                    response.raise_for_status()
+                    delay = 0.5
+                    received = False
+                    for line in response.iter_lines():
+                        stream = stream_ref()
+                        if stream is None:
+                            return
+                        if line.startswith(b'data: '):
+                            stream.resumes = orjson.loads(line[6:])
+                            received = True
+                        del stream
+                
+                # The backend ends each stream after a while; reconnect right away
+                if received:
+                    continue
+            except Exception:
+                pass
+            
+            # Fall back to fetching until the stream reconnects
+            stream = stream_ref()
+            if stream is not None:
+                stream.resumes = None
+            del stream
+            time.sleep(delay)
+            delay = min(delay * 2, 30)
+
+def get_recent_uploads_stream(base_url: str) -> RecentUploadsStream:
+    """Get the session's recent-uploads subscription, starting it if needed"""
+    
+    stream = st.session_state.get('recent_cache')
+    if stream is None or stream.base_url != base_url:
+        stream = st.session_state['recent_cache'] = RecentUploadsStream(base_url)
+    return stream
+
 def show_upload_resume():
     """Upload and parse resume page"""
     
     st.header("📤 Upload Resume")
     st.markdown("Upload a PDF resume to extract structured information using our AI-powered parser.")
     
+    # Recent uploads come from the backend's event stream once it is connected;
+    # until then they load in the background while the page (and any parse) runs
+    base_url = get_api_base_url()
+    recent_uploads = get_recent_uploads_stream(base_url).resumes
+    if recent_uploads is None:
+        recent_uploads = submit_fetch(get_recent_resumes, base_url)
+    just_parsed = None
+    
     # File uploader
     uploaded_file = st.file_uploader(
         "Choose a PDF resume",
@@ -27,122 +199,105 @@ def show_upload_resume():
         with col1:
             st.metric("File Name", uploaded_file.name)
         with col2:
-            file_size = len(uploaded_file.getvalue())
-            st.metric("File Size", f"{file_size / 1024:.1f} KB")
+            st.metric("File Size", f"{uploaded_file.size / 1024:.1f} KB")
         with col3:
             st.metric("File Type", uploaded_file.type)
         
         # Parse button
         if st.button("🚀 Parse Resume", type="primary"):
             
-            with st.spinner("Parsing resume... This may take a few seconds."):
-                
-                # Prepare file for upload
-                files = {
-                    'file': (uploaded_file.name, uploaded_file.getvalue(), 'application/pdf')
-                }
+            # Reject files the backend would refuse before sending them
+            if uploaded_file.size > MAX_UPLOAD_BYTES:
+                st.error(f"❌ File too large (maximum {MAX_UPLOAD_BYTES // (1024 * 1024)}MB)")
+            elif uploaded_file.type != 'application/pdf':
+                st.error("❌ Only PDF files are supported")
+            else:
+                # Identical files parse to identical results; reuse them within the session.
+                # getvalue() returns the upload's own bytes without copying (getbuffer()
+                # would force a copy of the copy-on-write BytesIO), so hash and send those
+                file_bytes = uploaded_file.getvalue()
+                cache_key = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+                parse_cache = get_parse_cache()
                 
-                try:
-                    # Make API request
-                    response = requests.post(
-                        f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/parse_resume",
-                        files=files
-                    )
+                if cache_key in parse_cache:
+                    parse_cache.move_to_end(cache_key)
+                    result = parse_cache[cache_key]
+                    st.success("✅ Resume parsed successfully!")
+                    st.session_state['last_parsed_resume'] = result
                     
-                    if response.status_code == 200:
-                        result = response.json()
+                else:
+                    with st.spinner("Parsing resume... This may take a few seconds."):
                         
-                        # Success message
-                        st.success("✅ Resume parsed successfully!")
+                        # Prepare file for upload
+                        files = {
+                            'file': (uploaded_file.name, file_bytes, 'application/pdf')
+                        }
                         
-                        # Store result in session state
-                        st.session_state['last_parsed_resume'] = result
-                        
-                        # Display parsed information
-                        display_parsed_resume(result)
-                        
-                    else:
-                        st.error(f"❌ Failed to parse resume: {response.text}")
-                        
-                except Exception as e:
-                    st.error(f"❌ Error uploading resume: {str(e)}")
+                        try:
+                            # Make API request
+                            response = SESSION.post(
+                                f"{base_url}/api/v1/parse_resume",
+                                files=files,
+                                timeout=(3, PARSE_READ_TIMEOUT)
+                            )
+                            
+                            if response.status_code == 200:
+                                result = orjson.loads(response.content)
+                                just_parsed = result
+                                parse_cache[cache_key] = result
+                                if len(parse_cache) > PARSE_CACHE_SIZE:
+                                    parse_cache.popitem(last=False)
+                                
+                                # Success message
+                                st.success("✅ Resume parsed successfully!")
+                                clear_resume_cache()
+                                
+                                # Store result in session state
+                                st.session_state['last_parsed_resume'] = result
+                                
+                            else:
+                                st.error(f"❌ Failed to parse resume: {response.text}")
+                                
+                        except Exception as e:
+                            st.error(f"❌ Error uploading resume: {str(e)}")
+        
+        # Display parsed information from session state, so its buttons still
+        # work on the reruns they trigger
+        parsed = st.session_state.get('last_parsed_resume')
+        if parsed and parsed.get('filename') == uploaded_file.name:
+            display_parsed_resume(parsed)
     
     # Show recent uploads
-    show_recent_uploads()
+    show_recent_uploads(recent_uploads, just_parsed)
 
 def display_parsed_resume(result: Dict):
     """Display parsed resume information"""
     
     st.subheader("📋 Parsed Information")
     
+    # Each section is sent as a single HTML block rather than one element per line
+    
     # Contact Information
     with st.expander("👤 Contact Information", expanded=True):
-        contact = result.get('contact_info', {})
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write(f"**Name:** {contact.get('name', 'Not found')}")
-            st.write(f"**Email:** {contact.get('email', 'Not found')}")
-        with col2:
-            st.write(f"**Phone:** {contact.get('phone', 'Not found')}")
-            st.write(f"**Location:** {contact.get('location', 'Not found')}")
-        
-        if contact.get('linkedin'):
-            st.write(f"**LinkedIn:** {contact['linkedin']}")
+        st.markdown(contact_card_html(result.get('contact_info', {})), unsafe_allow_html=True)
     
     # Skills
     with st.expander("💼 Skills", expanded=True):
-        skills = result.get('skills', {})
-        
-        if skills.get('technical'):
-            st.write("**Technical Skills:**")
-            st.write(", ".join(skills['technical']))
-        
-        if skills.get('soft'):
-            st.write("**Soft Skills:**")
-            st.write(", ".join(skills['soft']))
-        
-        if skills.get('certifications'):
-            st.write("**Certifications:**")
-            st.write(", ".join(skills['certifications']))
+        st.markdown(skills_card_html(result.get('skills', {})), unsafe_allow_html=True)
     
     # Experience
     with st.expander("💼 Work Experience"):
-        experience = result.get('experience', [])
-        
-        for i, exp in enumerate(experience, 1):
-            st.write(f"**{i}. {exp.get('title', 'Position')} at {exp.get('company', 'Company')}**")
-            if exp.get('start_date') or exp.get('end_date'):
-                st.write(f"Duration: {exp.get('start_date', '')} - {exp.get('end_date', '')}")
-            
-            if exp.get('details'):
-                for detail in exp['details'][:3]:  # Show first 3 details
-                    st.write(f"• {detail}")
-            st.write("---")
+        st.markdown(experience_card_html(result.get('experience', [])), unsafe_allow_html=True)
     
     # Education
     with st.expander("🎓 Education"):
-        education = result.get('education', [])
-        
-        for i, edu in enumerate(education, 1):
-            st.write(f"**{i}. {edu.get('degree', 'Degree')} - {edu.get('institution', 'Institution')}**")
-            if edu.get('field_of_study'):
-                st.write(f"Field: {edu['field_of_study']}")
-            if edu.get('gpa'):
-                st.write(f"GPA: {edu['gpa']}")
-            if edu.get('end_date'):
-                st.write(f"Graduation: {edu['end_date']}")
-            st.write("---")
+        st.markdown(education_card_html(result.get('education', [])), unsafe_allow_html=True)
     
     # Projects
     projects = result.get('projects', [])
     if projects:
         with st.expander("🚀 Projects"):
-            for i, project in enumerate(projects, 1):
-                st.write(f"**{i}. {project.get('name', 'Project')}**")
-                if project.get('description'):
-                    st.write(project['description'])
-                st.write("---")
+            st.markdown(projects_card_html(projects), unsafe_allow_html=True)
     
     # Action buttons
     col1, col2, col3 = st.columns(3)
@@ -159,30 +314,51 @@ def display_parsed_resume(result: Dict):
             st.session_state['page'] = "💡 Suggestions"
             st.rerun()
     
+    show_raw_key = f"show_raw_{result['id']}"
     with col3:
         if st.button("📄 View Raw Text"):
-            with st.expander("Raw Extracted Text", expanded=True):
-                st.text_area(
-                    "Raw Text",
-                    value=result.get('raw_text', ''),
-                    height=300,
-                    disabled=True
-                )
-
-def show_recent_uploads():
+            st.session_state[show_raw_key] = not st.session_state.get(show_raw_key, False)
+    
+    # Only ship the (truncated) raw text to the browser while the viewer is open
+    if st.session_state.get(show_raw_key, False):
+        raw_text = result.get('raw_text', '')
+        with st.expander("Raw Extracted Text", expanded=True):
+            st.text_area(
+                "Raw Text",
+                value=raw_text[:RAW_TEXT_DISPLAY_LIMIT],
+                height=300,
+                disabled=True
+            )
+            if len(raw_text) > RAW_TEXT_DISPLAY_LIMIT:
+                st.caption(f"Showing the first {RAW_TEXT_DISPLAY_LIMIT:,} of {len(raw_text):,} characters")
+
+def as_recent_upload(result: Dict) -> Dict:
+    """Convert a parse result into a recent uploads list entry"""
+    
+    contact = result.get('contact_info', {})
+    return {
+        'id': result['id'],
+        'filename': result['filename'],
+        'name': contact.get('name'),
+        'email': contact.get('email'),
+        'created_at': result.get('created_at', '')
+    }
+
+def show_recent_uploads(recent_uploads: Union[Future, List[Dict]], just_parsed: Optional[Dict] = None):
     """Show recent uploads"""
     
     st.subheader("📚 Recent Uploads")
     
     try:
-        # Get recent resumes
-        response = requests.get(
-            f"{st.session_state.get('api_base_url', 'http://localhost:8000')}/api/v1/resumes?page=1&page_size=5"
-        )
+        # Get recent resumes (streamed list, or the pending background fetch)
+        resumes = recent_uploads.result() if isinstance(recent_uploads, Future) else recent_uploads
         
-        if response.status_code == 200:
-            data = response.json()
-            resumes = data.get('resumes', [])
+        if resumes is not None:
+            # The list may predate the parse, so add the new resume ourselves
+            if just_parsed:
+                resumes = [as_recent_upload(just_parsed)] + [
+                    r for r in resumes if r['id'] != just_parsed['id']
+                ][:4]
             
             if resumes:
                 for resume in resumes:
@@ -219,5 +395,4 @@ def show_recent_uploads():
 
 # Set API base URL in session state if not set
 if 'api_base_url' not in st.session_state:
-    import os
     st.session_state['api_base_url'] = os.getenv("BACKEND_URL", "http://localhost:8000")
\ No newline at end of file
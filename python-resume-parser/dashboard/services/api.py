@@ -0,0 +1,142 @@
+"""
+Shared backend API helpers for dashboard pages
+"""
+
+import streamlit as st
+import hashlib
+import json
+import threading
+import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from typing import Any, Callable, Dict, List, Optional
+
+# Shared HTTP session so reruns reuse keep-alive connections to the backend
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+# Request results kept per session for each results cache
+RESULT_CACHE_SIZE = 20
+
+def get_api_base_url() -> str:
+    """Get the backend base URL for the current session"""
+    
+    return st.session_state.get('api_base_url', 'http://localhost:8000')
+
+def payload_key(payload: Dict) -> str:
+    """Stable fingerprint of a request payload"""
+    
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def get_cached_result(cache_name: str, key: str) -> Optional[Any]:
+    """Get a result from a per-session results cache, or None if it isn't cached"""
+    
+    cache = st.session_state.get(cache_name)
+    if cache is None or key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+def cache_result(cache_name: str, key: str, result: Any):
+    """Store a result in a per-session results cache, dropping the oldest entries"""
+    
+    cache = st.session_state.setdefault(cache_name, OrderedDict())
+    cache[key] = result
+    cache.move_to_end(key)
+    while len(cache) > RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def get_fetch_pool() -> ThreadPoolExecutor:
+    """Get the per-session thread pool used for concurrent backend fetches"""
+    
+    if '_fetch_pool' not in st.session_state:
+        st.session_state['_fetch_pool'] = ThreadPoolExecutor(max_workers=4)
+    return st.session_state['_fetch_pool']
+
+def submit_fetch(func: Callable, *args) -> Future:
+    """Run a fetcher on the session's thread pool with the script run context attached"""
+    
+    # Without the context, st.cache_data neither reads nor fills its cache
+    # from a pool thread (and logs a missing ScriptRunContext warning)
+    ctx = get_script_run_ctx()
+    
+    def run_with_script_ctx():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args)
+    
+    return get_fetch_pool().submit(run_with_script_ctx)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_resumes(base_url: str) -> List[Dict]:
+    """Fetch the resume list; raises on failure so errors aren't cached"""
+    
+    response = SESSION.get(
+        f"{base_url}/api/v1/resumes?page_size=50",
+        timeout=(3, 30)
+    )
+    response.raise_for_status()
+    return response.json().get('resumes', [])
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_job_descriptions(base_url: str) -> List[Dict]:
+    """Fetch saved job descriptions; raises on failure so errors aren't cached"""
+    
+    response = SESSION.get(
+        f"{base_url}/api/v1/job-descriptions",
+        timeout=(3, 30)
+    )
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_recent(base_url: str) -> List[Dict]:
+    """Fetch the five most recent resumes; raises on failure so errors aren't cached"""
+    
+    response = SESSION.get(
+        f"{base_url}/api/v1/resumes?page=1&page_size=5",
+        timeout=(3, 30)
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content).get('resumes', [])
+
+def get_available_resumes(base_url: str) -> List[Dict]:
+    """Get list of available resumes"""
+    
+    try:
+        return _fetch_resumes(base_url)
+    except Exception:
+        return []
+
+def get_recent_resumes(base_url: str) -> Optional[List[Dict]]:
+    """Get the five most recent resumes, or None if the backend rejects the request"""
+    
+    try:
+        return _fetch_recent(base_url)
+    except requests.HTTPError:
+        return None
+
+def get_saved_job_descriptions(base_url: str) -> List[Dict]:
+    """Get saved job descriptions"""
+    
+    try:
+        return _fetch_job_descriptions(base_url)
+    except Exception:
+        return []
+
+def clear_resume_cache():
+    """Drop the cached resume list after a resume is added or changed"""
+    
+    _fetch_resumes.clear()
+    _fetch_recent.clear()
+
+def clear_job_description_cache():
+    """Drop the cached job descriptions after one is saved"""
+    
+    _fetch_job_descriptions.clear()
@@ -3,17 +3,29 @@
 Test runner for Resume Parser & ATS Scoring System
 """
 
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import requests
+
+# Shared keep-alive session for every request the checks make
+SESSION = requests.Session()
+
 def run_command(cmd, cwd=None):
-    """Run command and return result"""
+    """Run command, echoing its output as it is produced, and return (success, error)"""
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
+        process = subprocess.Popen(
+            cmd, shell=True, cwd=cwd,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        )
+        for line in process.stdout:
+            print(line, end="")
+        return process.wait() == 0, ""
     except Exception as e:
-        return False, "", str(e)
+        return False, str(e)
 
 def run_backend_tests():
     """Run backend unit tests"""
@@ -25,47 +37,59 @@ def run_backend_tests():
         "tests/test_ats_scorer.py"
     ]
     
-    all_passed = True
-    
+    existing_files = []
     for test_file in test_files:
         if Path(test_file).exists():
-            print(f"\n📝 Running {test_file}...")
-            success, stdout, stderr = run_command(f"python -m pytest {test_file} -v")
-            
-            if success:
-                print(f"✅ {test_file} - PASSED")
-            else:
-                print(f"❌ {test_file} - FAILED")
-                print(f"Error: {stderr}")
-                all_passed = False
+            existing_files.append(test_file)
         else:
             print(f"⚠️ {test_file} not found")
     
-    return all_passed
+    if not existing_files:
+        return True
+    
+    # One pytest process for all files so pytest and plugins are imported once
+    print(f"\n📝 Running {', '.join(existing_files)}...")
+    success, error = run_command(
+        f"python -m pytest {' '.join(existing_files)} -v --tb=short -p no:cacheprovider"
+    )
+    
+    if success:
+        print("✅ Backend tests - PASSED")
+    else:
+        print("❌ Backend tests - FAILED")
+        if error:
+            print(f"Error: {error}")
+    
+    return success
 
 def test_api_endpoints():
     """Test API endpoints are working"""
     print("\n🌐 Testing API Endpoints")
     print("-" * 30)
     
-    import requests
+    import random
     import time
     
-    # Wait for backend to be ready
-    max_retries = 5
+    # Wait for backend to be ready, backing off exponentially (with jitter)
+    # so a backend that is already up is detected almost immediately
+    max_retries = 8
+    delay = 0.1
     for i in range(max_retries):
         try:
-            response = requests.get("http://localhost:8000/health", timeout=5)
+            response = SESSION.get("http://localhost:8000/health", timeout=1)
             if response.status_code == 200:
                 print("✅ Backend is running")
                 break
-        except:
-            if i < max_retries - 1:
-                print(f"⏳ Waiting for backend... ({i+1}/{max_retries})")
-                time.sleep(2)
-            else:
-                print("❌ Backend not responding")
-                return False
+        except Exception:
+            pass
+        
+        if i < max_retries - 1:
+            print(f"⏳ Waiting for backend... ({i+1}/{max_retries})")
+            time.sleep(delay + random.random() * 0.05)
+            delay = min(delay * 2, 2.0)
+        else:
+            print("❌ Backend not responding")
+            return False
     
     # Test endpoints
     endpoints = [
@@ -80,7 +104,7 @@ def test_api_endpoints():
     for method, endpoint, description in endpoints:
         try:
             if method == "GET":
-                response = requests.get(f"http://localhost:8000{endpoint}", timeout=5)
+                response = SESSION.get(f"http://localhost:8000{endpoint}", timeout=5)
             
             if response.status_code in [200, 404]:  # 404 is ok for empty lists
                 print(f"✅ {description}: {response.status_code}")
@@ -99,21 +123,40 @@ def test_sample_resume_parsing():
     print("\n📄 Testing Resume Parsing")
     print("-" * 30)
     
-    sample_resumes = Path("data/resumes").glob("*.pdf")
+    # scandir reports file types from the directory listing, without a stat per entry
+    sample_resumes = []
+    if os.path.isdir("data/resumes"):
+        with os.scandir("data/resumes") as entries:
+            sample_resumes = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file(follow_symlinks=False)
+            )
     
-    for resume_path in sample_resumes:
-        print(f"\n📝 Testing {resume_path.name}...")
-        
+    def parse(resume_path):
+        """Upload one sample resume; exceptions are returned so they report in order"""
         try:
-            import requests
-            
             with open(resume_path, 'rb') as f:
                 files = {'file': (resume_path.name, f, 'application/pdf')}
-                response = requests.post(
+                return SESSION.post(
                     "http://localhost:8000/api/v1/parse_resume",
                     files=files,
                     timeout=30
                 )
+        except Exception as e:
+            return e
+    
+    # Samples are independent, so parse up to 4 at a time and report in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(parse, sample_resumes))
+    
+    all_passed = True
+    
+    for resume_path, response in zip(sample_resumes, responses):
+        print(f"\n📝 Testing {resume_path.name}...")
+        
+        try:
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 result = response.json()
@@ -124,13 +167,13 @@ def test_sample_resume_parsing():
             else:
                 print(f"❌ Parsing failed: {response.status_code}")
                 print(f"   Error: {response.text}")
-                return False
+                all_passed = False
                 
         except Exception as e:
             print(f"❌ Error testing {resume_path.name}: {str(e)}")
-            return False
+            all_passed = False
     
-    return True
+    return all_passed
 
 def test_scoring_functionality():
     """Test ATS scoring"""
@@ -139,9 +182,7 @@ def test_scoring_functionality():
     
     # First, get a resume ID
     try:
-        import requests
-        
-        response = requests.get("http://localhost:8000/api/v1/resumes", timeout=5)
+        response = SESSION.get("http://localhost:8000/api/v1/resumes", timeout=5)
         if response.status_code != 200:
             print("❌ Cannot get resumes for scoring test")
             return False
@@ -166,7 +207,7 @@ def test_scoring_functionality():
             "company": "Test Company"
         }
         
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/api/v1/score_resume",
             json=scoring_data,
             timeout=30
@@ -7,15 +7,23 @@ import os
 import sys
 import subprocess
 import platform
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and return success status"""
+def run_command(cmd, cwd=None, log_file=None):
+    """Run a command and return success status, optionally appending its output to log_file"""
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+        if log_file:
+            with open(log_file, "a") as log:
+                log.write(f"$ {cmd}\n")
+                log.flush()
+                result = subprocess.run(cmd, shell=True, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, text=True)
+        else:
+            result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
         if result.returncode != 0:
             print(f"Error running: {cmd}")
-            print(f"Error output: {result.stderr}")
+            print(f"Error output: see {log_file}" if log_file else f"Error output: {result.stderr}")
             return False
         return True
     except Exception as e:
@@ -36,7 +44,7 @@ def check_system_dependencies():
     print("🔍 Checking system dependencies...")
     
     # Check tesseract
-    if not run_command("tesseract --version"):
+    if shutil.which("tesseract") is None:
         print("❌ Tesseract OCR not found. Please install:")
         if platform.system() == "Darwin":  # macOS
             print("   brew install tesseract")
@@ -48,20 +56,20 @@ def check_system_dependencies():
     else:
         print("✅ Tesseract OCR found")
     
-    # Check poppler (for pdf2image)
+    # Check poppler (for pdf2image, which shells out to pdftoppm)
     if platform.system() == "Darwin":
-        if not run_command("brew list poppler"):
+        if shutil.which("pdftoppm") is None:
             print("❌ Poppler not found. Install with: brew install poppler")
             return False
     elif platform.system() == "Linux":
-        if not run_command("pkg-config --exists poppler"):
+        if shutil.which("pdftoppm") is None:
             print("❌ Poppler not found. Install with: sudo apt-get install poppler-utils")
             return False
     
     print("✅ All system dependencies found")
     return True
 
-def setup_backend():
+def setup_backend(log_file=None):
     """Setup backend dependencies"""
     print("\n🔧 Setting up backend...")
     
@@ -72,31 +80,25 @@ def setup_backend():
     
     # Install Python dependencies
     print("📦 Installing Python dependencies...")
-    if not run_command("pip install -r requirements.txt", cwd="backend"):
+    if not run_command("pip install -r requirements.txt", cwd="backend", log_file=log_file):
         print("❌ Failed to install backend dependencies")
         return False
     
-    # Download NLTK data
-    print("📚 Downloading NLTK data...")
-    nltk_commands = [
-        "python -c \"import nltk; nltk.download('punkt', quiet=True)\"",
-        "python -c \"import nltk; nltk.download('stopwords', quiet=True)\"", 
-        "python -c \"import nltk; nltk.download('wordnet', quiet=True)\""
-    ]
-    
-    for cmd in nltk_commands:
-        if not run_command(cmd, cwd="backend"):
-            print(f"⚠️ Warning: Failed to download NLTK data: {cmd}")
-    
-    # Download spaCy model
-    print("🧠 Downloading spaCy model...")
-    if not run_command("python -m spacy download en_core_web_sm", cwd="backend"):
-        print("⚠️ Warning: Failed to download spaCy model")
+    # Download NLTK data and the spaCy model in one interpreter
+    print("📚 Downloading NLTK data and spaCy model...")
+    download_script = (
+        "import sys, nltk, spacy.cli; "
+        "ok = all([nltk.download(p, quiet=True) for p in ('punkt', 'stopwords', 'wordnet')]); "
+        "spacy.cli.download('en_core_web_sm'); "
+        "sys.exit(0 if ok else 1)"
+    )
+    if not run_command(f'python -c "{download_script}"', cwd="backend", log_file=log_file):
+        print("⚠️ Warning: Failed to download NLTK data or spaCy model")
     
     print("✅ Backend setup complete")
     return True
 
-def setup_dashboard():
+def setup_dashboard(log_file=None):
     """Setup dashboard dependencies"""
     print("\n🎨 Setting up dashboard...")
     
@@ -106,7 +108,7 @@ def setup_dashboard():
         return False
     
     # Install dependencies
-    if not run_command("pip install -r requirements.txt", cwd="dashboard"):
+    if not run_command("pip install -r requirements.txt", cwd="dashboard", log_file=log_file):
         print("❌ Failed to install dashboard dependencies")
         return False
     
@@ -139,10 +141,9 @@ def copy_sample_data():
     # Copy existing sample resumes from public directory
     public_resumes = Path("../public/resume-example")
     if public_resumes.exists():
-        import shutil
         for resume_file in public_resumes.glob("*.pdf"):
             dest = sample_dir / resume_file.name
-            shutil.copy2(resume_file, dest)
+            shutil.copyfile(resume_file, dest)
             print(f"✅ Copied: {resume_file.name}")
     else:
         print("⚠️ No sample resumes found in ../public/resume-example/")
@@ -221,16 +222,19 @@ def main():
     # Create env file
     create_env_file()
     
-    # Setup backend
-    if not setup_backend():
-        return False
-    
-    # Setup dashboard
-    if not setup_dashboard():
-        return False
-    
-    # Copy sample data
-    copy_sample_data()
+    # Install dependencies while sample data is copied alongside. The backend
+    # and dashboard installs stay sequential since both pip into the same
+    # environment; their output goes to separate log files.
+    def setup_dependencies():
+        return (setup_backend(log_file=Path("logs/setup_backend.log").resolve())
+                and setup_dashboard(log_file=Path("logs/setup_dashboard.log").resolve()))
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dependencies = executor.submit(setup_dependencies)
+        sample_data = executor.submit(copy_sample_data)
+        sample_data.result()
+        if not dependencies.result():
+            return False
     
     # Run basic tests
     run_tests()
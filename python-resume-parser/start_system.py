@@ -4,9 +4,10 @@ Startup script for Resume Parser & ATS Scoring System
 Starts both backend and dashboard in development mode
 """
 
+import asyncio
+import http.client
 import os
 import sys
-import subprocess
 import time
 import signal
 import threading
@@ -44,7 +45,7 @@ def check_dependencies():
     print_colored("✅ Dependency files found", Colors.GREEN)
     return True
 
-def start_backend():
+async def start_backend():
     """Start the FastAPI backend"""
     print_colored("🚀 Starting FastAPI backend...", Colors.BLUE)
     
@@ -59,13 +60,14 @@ def start_backend():
         env = os.environ.copy()
         env['PYTHONPATH'] = str(backend_dir.absolute())
         
-        process = subprocess.Popen([
+        process = await asyncio.create_subprocess_exec(
             sys.executable, "-m", "uvicorn", 
             "app.main:app", 
             "--host", "0.0.0.0", 
             "--port", "8000", 
-            "--reload"
-        ], cwd=backend_dir, env=env)
+            "--reload",
+            cwd=backend_dir, env=env
+        )
         
         return process
         
@@ -73,7 +75,7 @@ def start_backend():
         print_colored(f"❌ Failed to start backend: {e}", Colors.RED)
         return None
 
-def start_dashboard():
+async def start_dashboard():
     """Start the Streamlit dashboard"""
     print_colored("🎨 Starting Streamlit dashboard...", Colors.BLUE)
     
@@ -88,12 +90,13 @@ def start_dashboard():
         env['PYTHONPATH'] = str(dashboard_dir.absolute())
         env['BACKEND_URL'] = 'http://localhost:8000'
         
-        process = subprocess.Popen([
+        process = await asyncio.create_subprocess_exec(
             sys.executable, "-m", "streamlit", 
             "run", "app.py", 
             "--server.port=8501",
-            "--server.address=0.0.0.0"
-        ], cwd=dashboard_dir, env=env)
+            "--server.address=0.0.0.0",
+            cwd=dashboard_dir, env=env
+        )
         
         return process
         
@@ -101,23 +104,36 @@ def start_dashboard():
         print_colored(f"❌ Failed to start dashboard: {e}", Colors.RED)
         return None
 
-def wait_for_backend():
-    """Wait for backend to be ready"""
-    import requests
-    
+def wait_for_backend(stop_event: threading.Event):
+    """Wait for backend to be ready, giving up early once stop_event is set"""
     print_colored("⏳ Waiting for backend to start...", Colors.YELLOW)
     
-    for i in range(30):  # Wait up to 30 seconds
-        try:
-            response = requests.get("http://localhost:8000/health", timeout=2)
-            if response.status_code == 200:
-                print_colored("✅ Backend is ready!", Colors.GREEN)
-                return True
-        except:
-            pass
-        
-        time.sleep(1)
-        print(".", end="", flush=True)
+    # One keep-alive connection for every probe; probe quickly at first and
+    # back off to at most 500 ms between attempts. A failed connection is
+    # closed so the next request reconnects.
+    conn = http.client.HTTPConnection("localhost", 8000, timeout=1)
+    try:
+        deadline = time.monotonic() + 30  # Wait up to 30 seconds
+        delay = 0.05
+        while time.monotonic() < deadline and not stop_event.is_set():
+            try:
+                conn.request("GET", "/health")
+                response = conn.getresponse()
+                response.read()
+                if response.status == 200:
+                    print_colored("✅ Backend is ready!", Colors.GREEN)
+                    return True
+            except (OSError, http.client.HTTPException):
+                conn.close()
+            
+            stop_event.wait(delay)
+            delay = min(delay * 1.5, 0.5)
+            print(".", end="", flush=True)
+    finally:
+        conn.close()
+    
+    if stop_event.is_set():
+        return False
     
     print_colored("\n❌ Backend failed to start within 30 seconds", Colors.RED)
     return False
@@ -133,37 +149,51 @@ def create_directories():
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals"""
+async def shutdown():
+    """Stop all started processes"""
     print_colored("\n🛑 Shutting down system...", Colors.YELLOW)
     
     # Terminate processes
     for process in active_processes:
-        if process and process.poll() is None:
+        if process.returncode is None:
             process.terminate()
     
-    # Wait for processes to terminate
-    time.sleep(2)
+    # Wait up to 2 seconds for processes to terminate, returning as soon as
+    # they have all exited
+    if active_processes:
+        await asyncio.wait(
+            [asyncio.ensure_future(process.wait()) for process in active_processes],
+            timeout=2
+        )
     
     # Force kill if necessary
     for process in active_processes:
-        if process and process.poll() is None:
+        if process.returncode is None:
             process.kill()
     
+    # Reap the processes so they don't outlive the event loop
+    await asyncio.gather(*(process.wait() for process in active_processes))
+    
     print_colored("👋 System shutdown complete", Colors.GREEN)
-    sys.exit(0)
 
 # Global list to track processes
 active_processes = []
 
-def main():
+async def main():
     """Main startup function"""
     print_colored("🚀 Resume Parser & ATS Scoring System", Colors.BOLD + Colors.BLUE)
     print_colored("=" * 50, Colors.BLUE)
     
     # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    loop = asyncio.get_running_loop()
+    stop_requested = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_requested.set)
+        except NotImplementedError:
+            # Windows event loops don't support signal handlers; Ctrl+C there
+            # cancels this task instead, and the finally below still shuts down
+            pass
     
     # Check dependencies
     if not check_dependencies():
@@ -174,53 +204,69 @@ def main():
     create_directories()
     
     # Start backend
-    backend_process = start_backend()
+    backend_process = await start_backend()
     if not backend_process:
         return False
     
     active_processes.append(backend_process)
     
-    # Wait for backend to be ready
-    if not wait_for_backend():
-        backend_process.terminate()
-        return False
-    
-    # Start dashboard
-    dashboard_process = start_dashboard()
-    if not dashboard_process:
-        backend_process.terminate()
-        return False
-    
-    active_processes.append(dashboard_process)
-    
-    # Print access information
-    print_colored("\n🎉 System started successfully!", Colors.GREEN + Colors.BOLD)
-    print_colored("-" * 40, Colors.GREEN)
-    print_colored("📡 Backend API: http://localhost:8000", Colors.GREEN)
-    print_colored("📚 API Docs: http://localhost:8000/docs", Colors.GREEN)
-    print_colored("🎨 Dashboard: http://localhost:8501", Colors.GREEN)
-    print_colored("-" * 40, Colors.GREEN)
-    print_colored("Press Ctrl+C to stop the system", Colors.YELLOW)
-    
-    # Keep processes running
+    stop_task = asyncio.create_task(stop_requested.wait())
+    stop_probe = threading.Event()
     try:
-        while True:
-            # Check if processes are still running
-            if backend_process.poll() is not None:
-                print_colored("❌ Backend process stopped unexpectedly", Colors.RED)
-                break
-            
-            if dashboard_process.poll() is not None:
-                print_colored("❌ Dashboard process stopped unexpectedly", Colors.RED)
-                break
-            
-            time.sleep(1)
-            
-    except KeyboardInterrupt:
-        signal_handler(signal.SIGINT, None)
+        # Start the dashboard while waiting for the backend to be ready; it only
+        # calls the backend once a user interacts with it
+        startup = asyncio.gather(
+            start_dashboard(),
+            asyncio.to_thread(wait_for_backend, stop_probe)
+        )
+        
+        # A shutdown signal during startup stops the readiness probe early
+        await asyncio.wait([startup, stop_task], return_when=asyncio.FIRST_COMPLETED)
+        if stop_task.done():
+            stop_probe.set()
+        
+        dashboard_process, backend_ready = await startup
+        if dashboard_process:
+            active_processes.append(dashboard_process)
+        
+        if stop_task.done():
+            return True
+        if not backend_ready or not dashboard_process:
+            return False
+        
+        # Print access information
+        print_colored("\n🎉 System started successfully!", Colors.GREEN + Colors.BOLD)
+        print_colored("-" * 40, Colors.GREEN)
+        print_colored("📡 Backend API: http://localhost:8000", Colors.GREEN)
+        print_colored("📚 API Docs: http://localhost:8000/docs", Colors.GREEN)
+        print_colored("🎨 Dashboard: http://localhost:8501", Colors.GREEN)
+        print_colored("-" * 40, Colors.GREEN)
+        print_colored("Press Ctrl+C to stop the system", Colors.YELLOW)
+        
+        # Keep processes running until one exits or a shutdown signal arrives
+        watchers = {
+            asyncio.create_task(backend_process.wait()): "Backend",
+            asyncio.create_task(dashboard_process.wait()): "Dashboard"
+        }
+        done, _ = await asyncio.wait([stop_task, *watchers], return_when=asyncio.FIRST_COMPLETED)
+        
+        # Check if processes are still running
+        for task in done:
+            if task in watchers:
+                print_colored(f"❌ {watchers[task]} process stopped unexpectedly", Colors.RED)
+        
+        return True
     
-    return True
+    finally:
+        # Also runs when Ctrl+C cancels main() on loops without signal handlers
+        stop_probe.set()
+        stop_task.cancel()
+        await shutdown()
 
 if __name__ == "__main__":
-    success = main()
+    try:
+        success = asyncio.run(main())
+    except KeyboardInterrupt:
+        # main() has already stopped the child processes
+        success = False
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -33,6 +33,20 @@ def test_imports():
         print(f"❌ Import error: {e}")
         return False
 
+def _try_import(package):
+    """Import a package by name and return (package, ok)"""
+    try:
+        if package == 'pdfminer':
+            import pdfminer.high_level
+        elif package == 'sklearn':
+            import sklearn
+        else:
+            __import__(package)
+        return package, True
+    except Exception:
+        # A package that fails while initialising is as unusable as a missing one
+        return package, False
+
 def test_dependencies():
     """Test required dependencies are available"""
     print("🔍 Testing dependencies...")
@@ -50,16 +64,10 @@ def test_dependencies():
     
     missing = []
     
-    for package in required_packages:
-        try:
-            if package == 'pdfminer':
-                import pdfminer.high_level
-            elif package == 'sklearn':
-                import sklearn
-            else:
-                __import__(package)
+    for package, ok in map(_try_import, required_packages):
+        if ok:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package}")
             missing.append(package)
     
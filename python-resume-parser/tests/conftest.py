@@ -0,0 +1,26 @@
+"""
+Shared fixtures for backend service tests
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from app.services.ats_scorer import ATSScorerService
+from app.services.resume_parser import ResumeParserService
+
+# The services load spaCy/NLTK resources on construction and tests don't
+# mutate them, so one instance of each is shared across the whole run
+
+@pytest.fixture(scope="session")
+def parser():
+    """Create parser instance for testing"""
+    return ResumeParserService()
+
+@pytest.fixture(scope="session")
+def scorer():
+    """Create scorer instance for testing"""
+    return ATSScorerService()
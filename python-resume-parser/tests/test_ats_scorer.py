@@ -9,16 +9,9 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from app.services.ats_scorer import ATSScorerService
-
 class TestATSScorer:
     """Test suite for ATS scoring functionality"""
     
-    @pytest.fixture
-    def scorer(self):
-        """Create scorer instance for testing"""
-        return ATSScorerService()
-    
     def test_scorer_initialization(self, scorer):
         """Test scorer initializes correctly"""
         assert scorer is not None
@@ -49,6 +42,19 @@ class TestATSScorer:
         assert any('python' in kw.lower() for kw in keywords)
         assert any('react' in kw.lower() for kw in keywords)
     
+    def test_jd_keyword_cache(self, scorer):
+        """Test repeated job descriptions hit the keyword cache and return independent copies"""
+        jd_text = "Backend developer skilled in Python, Django, PostgreSQL and Docker."
+        
+        first = scorer.extract_jd_keywords(jd_text, top_n=10)
+        hits = scorer._jd_keywords_cached.cache_info().hits
+        first.clear()
+        second = scorer.extract_jd_keywords(jd_text, top_n=10)
+        
+        assert scorer._jd_keywords_cached.cache_info().hits == hits + 1
+        assert len(second) > 0
+        assert second == scorer.extract_keywords_from_text(jd_text, top_n=10)
+    
     def test_tfidf_similarity(self, scorer):
         """Test TF-IDF similarity computation"""
         resume_text = """
@@ -106,6 +112,7 @@ class TestATSScorer:
         assert 'feedback' in result
         assert 0.0 <= result['score'] <= 1.0
     
+    @pytest.mark.asyncio
     async def test_full_resume_scoring(self, scorer):
         """Test complete resume scoring"""
         sample_resume = {
@@ -157,6 +164,36 @@ class TestATSScorer:
         assert 'experience' in section_names
         assert 'education' in section_names
     
+    @pytest.mark.asyncio
+    async def test_batch_resume_scoring(self, scorer):
+        """Test scoring several resumes against one job description"""
+        strong_resume = {
+            'skills': {'technical': ['Python', 'React', 'AWS']},
+            'experience': [{'title': 'Software Engineer', 'details': ['Developed React applications on AWS']}],
+            'education': [{'degree': 'BS Computer Science'}],
+            'raw_text': "Software Engineer skilled in Python, React and AWS. BS Computer Science."
+        }
+        weak_resume = {
+            'skills': {'technical': ['Photoshop']},
+            'experience': [{'title': 'Designer', 'details': ['Created marketing graphics']}],
+            'education': [],
+            'raw_text': "Graphic designer creating marketing graphics in Photoshop."
+        }
+        
+        job_description = """
+        Software Engineer position requiring Python, React, and AWS experience.
+        Computer Science degree preferred.
+        """
+        
+        results = await scorer.score_resumes_batch([strong_resume, weak_resume], job_description)
+        
+        assert len(results) == 2
+        for result in results:
+            assert 0.0 <= result['overall_score'] <= 1.0
+            assert set(result['section_scores']) == {'skills', 'experience', 'education'}
+        
+        assert results[0]['overall_score'] > results[1]['overall_score']
+    
     def test_suggestions_generation(self, scorer):
         """Test improvement suggestions generation"""
         sample_score_data = {
@@ -216,8 +253,8 @@ class TestATSScorer:
         """
         
         # Count impact words
-        impact_count_good = sum(1 for word in scorer.impact_words if word in experience_with_impact.lower())
-        impact_count_bad = sum(1 for word in scorer.impact_words if word in experience_without_impact.lower())
+        impact_count_good = scorer.count_impact_words(experience_with_impact)
+        impact_count_bad = scorer.count_impact_words(experience_without_impact)
         
         assert impact_count_good > impact_count_bad
         assert impact_count_good >= 3  # Should find "developed", "improved", "led", "implemented"
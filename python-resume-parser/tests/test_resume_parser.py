@@ -11,16 +11,9 @@ import sys
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from app.services.resume_parser import ResumeParserService
-
 class TestResumeParser:
     """Test suite for resume parsing functionality"""
     
-    @pytest.fixture
-    def parser(self):
-        """Create parser instance for testing"""
-        return ResumeParserService()
-    
     def test_parser_initialization(self, parser):
         """Test parser initializes correctly"""
         assert parser is not None
@@ -151,10 +144,6 @@ class TestResumeParser:
 class TestResumeParserIntegration:
     """Integration tests with actual PDF files"""
     
-    @pytest.fixture
-    def parser(self):
-        return ResumeParserService()
-    
     @pytest.mark.skipif(
         not os.path.exists("../public/resume-example/openresume-resume.pdf"),
         reason="Sample PDF not found"